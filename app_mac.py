@@ -29,8 +29,9 @@ Data flow:
   replay buffered keystrokes → restore original clipboard.
 
 External processes:
-  - ``osascript`` is invoked for system volume get/set/mute only, with
-    hardcoded AppleScript one-liners (no user-controlled arguments).
+  - ``osascript`` is invoked for system volume get/set/mute only when the
+    output device doesn't expose CoreAudio volume/mute, with hardcoded
+    AppleScript one-liners (no user-controlled arguments).
 
 Sections that touch privileged macOS APIs are marked with
 ``# ~~~ SECURITY-SENSITIVE ~~~`` so reviewers can grep for them.
@@ -40,13 +41,15 @@ import sys
 import os
 
 import argparse
-import json5
+import functools
+import json
+import re
 import time
 import threading
+import queue
 import subprocess
 import numpy as np
 import sounddevice as sd
-import mlx_whisper
 
 import objc
 import AppKit
@@ -89,6 +92,7 @@ from Quartz import (
     kCGEventTapOptionDefault,
     kCGEventFlagMaskCommand,
     kCGEventSourceStatePrivate,
+    kCGKeyboardEventKeycode,
 )
 from Foundation import NSRunLoop, NSDate, CFRunLoopGetCurrent, CFRunLoopRunInMode, NSMakeRect, NSObject
 from AppKit import NSPasteboardTypeString, NSStatusBar, NSVariableStatusItemLength, NSFont
@@ -166,12 +170,37 @@ KEYCODE_MAP = {
     "pause": 0x71,
 }
 
-# Reverse map: keycode -> name (prefer shorter canonical names)
+# Reverse map: keycode -> name. Where aliases share a code the longest,
+# most descriptive name wins ("escape", "return", "backspace", "pause");
+# rebinds save these names, so existing settings files depend on them.
 KEYCODE_TO_NAME = {}
-for _name, _code in sorted(KEYCODE_MAP.items(), key=lambda x: -len(x[0])):
-    KEYCODE_TO_NAME[_code] = _name
-for _name, _code in sorted(KEYCODE_MAP.items(), key=lambda x: len(x[0])):
-    KEYCODE_TO_NAME[_code] = _name
+for _name, _code in KEYCODE_MAP.items():
+    if _code not in KEYCODE_TO_NAME or len(_name) > len(KEYCODE_TO_NAME[_code]):
+        KEYCODE_TO_NAME[_code] = _name
+
+
+def name_for_keycode(keycode):
+    """Return the setting name for a keycode; "key_<n>" if it has no name."""
+    name = KEYCODE_TO_NAME.get(keycode)
+    if name is None:
+        name = f"key_{keycode}"  # only formatted for unnamed keys
+    return name
+
+
+def keycode_for_name(name):
+    """Return the keycode for a key setting, or None if it is unset or unknown.
+
+    Accepts KEYCODE_MAP names in any case and the "key_<n>" form that
+    rebinding saves for keys without a name.
+    """
+    if not name:
+        return None
+    name = name.lower()
+    if name in KEYCODE_MAP:
+        return KEYCODE_MAP[name]
+    if name.startswith("key_") and name[4:].isdigit():
+        return int(name[4:])
+    return None
 
 
 VERSION = "1.0.0"
@@ -186,8 +215,23 @@ MLX_MODEL_REPOS = {
     "large":  "mlx-community/whisper-large-v3-mlx",
     "turbo":  "mlx-community/whisper-turbo",
 }
+# 4-bit quantized variants: inference is memory-bandwidth bound, so
+# smaller weights decode faster and need about a quarter of the RAM
+MLX_MODEL_REPOS_Q4 = {
+    "tiny":   "mlx-community/whisper-tiny-mlx-4bit",
+    "base":   "mlx-community/whisper-base-mlx-4bit",
+    "small":  "mlx-community/whisper-small-mlx-4bit",
+    "medium": "mlx-community/whisper-medium-mlx-4bit",
+    "large":  "mlx-community/whisper-large-v3-mlx-4bit",
+    "turbo":  "mlx-community/whisper-large-v3-turbo-q4",
+}
+PRECISIONS = ["fp16", "q4"]
 SAMPLE_RATE = 16000
 
+# Settings copied as-is from the file; key settings also map ""/null to unbound
+PLAIN_SETTINGS = ("mode", "after_action", "window_target")
+KEY_SETTINGS = ("hotkey", "cancel_key", "no_enter_key")
+
 
 def _get_app_dir():
     """Return the directory containing the executable (frozen) or script.
@@ -211,6 +255,24 @@ def _get_app_dir():
 DEFAULT_SETTINGS_PATH = os.path.join(_get_app_dir(), "settings.json5")
 LOG_PATH = os.path.join(_get_app_dir(), "vibe-code-mic.log")
 
+# A string, a // comment, or a trailing comma; strings are matched first so
+# "//" or "," inside a value is left alone
+_JSON5_EXTRAS = re.compile(r'("(?:\\.|[^"\\])*")|//[^\n]*|,(?=\s*[}\]])')
+
+
+def parse_settings(content):
+    """Parse the settings file, which is JSON plus // comments and trailing commas.
+
+    Strips those with one regex so stdlib json can read what _write_settings
+    writes; anything else hand-edited (block comments, single quotes, ...)
+    falls back to the much slower json5.
+    """
+    try:
+        return json.loads(_JSON5_EXTRAS.sub(lambda m: m.group(1) or "", content))
+    except json.JSONDecodeError:
+        import json5
+        return json5.loads(content)
+
 # Open a persistent log file for library output
 _log_file = open(LOG_PATH, "a")
 
@@ -218,6 +280,12 @@ _log_file = open(LOG_PATH, "a")
 sys.stdout = _log_file
 sys.stderr = _log_file
 
+# Point fds 1 and 2 at the log too, so native output (PortAudio, MLX) isn't lost
+_log_fd = os.open(LOG_PATH, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+os.dup2(_log_fd, 1)
+os.dup2(_log_fd, 2)
+os.close(_log_fd)
+
 
 def _dlog(msg):
     """Write a timestamped diagnostic line to the log file."""
@@ -232,36 +300,36 @@ def _dlog(msg):
 # ── Timing & threshold constants ─────────────────────────────────
 MAX_RECORDING_DURATION = 30.0        # seconds - auto-stop recording
 MIN_AUDIO_DURATION = 0.3             # seconds - skip if shorter
+AUDIO_BUFFER_SECONDS = 32            # max duration plus slack for the auto-stop thread
+SILENCE_RMS_THRESHOLD = 0.003        # below this the clip is treated as room noise
 
 # Paste/type workflow timing (seconds)
 PASTE_KEY_DOWN_DELAY = 0.05          # after Cmd+V key down
 PASTE_PRE_ENTER_DELAY = 0.10         # before pressing Enter
 ENTER_KEY_DOWN_DELAY = 0.05          # after Enter key down
 PASTE_SETTLE_DELAY = 0.20            # wait for paste to be consumed
-CLIPBOARD_RESTORE_DELAY = 0.30       # extra wait before restoring clipboard
+CLIPBOARD_RESTORE_DELAY = 0.30       # after the paste, before restoring clipboard
 SWITCH_BACK_DELAY = 0.10             # after switching back to original app
 PRE_REPLAY_DELAY = 0.05              # before replaying captured keystrokes
 KEYSTROKE_REPLAY_INTERVAL = 0.008    # between each replayed keystroke
 
-# Window switch polling
-WINDOW_SWITCH_POLL_INTERVAL = 0.050  # CFRunLoop pump per poll iteration
-WINDOW_SWITCH_MAX_POLLS = 20         # max iterations waiting for app switch
+# Window switching
+WINDOW_SWITCH_TIMEOUT = 1.0          # max wait for the activation notification
 POST_SWITCH_SETTLE = 0.050           # settle after confirming switch
 
-# CFRunLoop pump internals
-PUMP_INTERVAL = 0.010                # CFRunLoop iteration length
-PUMP_SLEEP = 0.005                   # sleep between pump iterations
-
 # Event capture
 MAX_CAPTURED_EVENTS = 256            # buffer limit for captured keystrokes
+# Event types the system sends when it has switched our tap off
+TAP_DISABLED_EVENTS = frozenset((kCGEventTapDisabledByTimeout, kCGEventTapDisabledByUserInput))
 
 # Key rebinding
-REBIND_POLL_INTERVAL = 0.1           # seconds between checks
-REBIND_TIMEOUT_POLLS = 100           # max iterations (10s total)
+REBIND_TIMEOUT = 10.0                # seconds to wait for the new key
 
 # UI
 QUIT_DELAY = 0.3                     # pause before quitting
-GUI_TIMER_INTERVAL = 0.1             # NSTimer interval for UI refresh
+GUI_TIMER_INTERVAL = 0.1             # NSTimer interval for UI refresh (runs only while busy)
+GUI_TIMER_TOLERANCE = 0.02           # slack macOS may use to coalesce timer wakeups
+TAP_RETRY_INTERVAL = 1.0             # how often an idle tick re-checks Accessibility
 
 
 def get_input_devices():
@@ -310,27 +378,110 @@ def ax_set_focused_window(app_ref, window_ref):
     )
 
 
-# ── macOS volume control via osascript ── # ~~~ SECURITY-SENSITIVE ~~~
-# Invokes osascript subprocess with hardcoded AppleScript commands only.
+# ── macOS volume control ── # ~~~ SECURITY-SENSITIVE ~~~
+# Reads/sets the default output device's volume and mute through the
+# CoreAudio HAL; falls back to osascript with hardcoded AppleScript
+# commands if the device doesn't expose those properties.
+
+_coreaudio_lib = ctypes.cdll.LoadLibrary(ctypes.util.find_library("CoreAudio"))
+
+
+class AudioObjectPropertyAddress(ctypes.Structure):
+    _fields_ = [
+        ("mSelector", ctypes.c_uint32),
+        ("mScope", ctypes.c_uint32),
+        ("mElement", ctypes.c_uint32),
+    ]
+
+
+_coreaudio_lib.AudioObjectGetPropertyData.argtypes = [
+    ctypes.c_uint32, ctypes.POINTER(AudioObjectPropertyAddress),
+    ctypes.c_uint32, ctypes.c_void_p, ctypes.POINTER(ctypes.c_uint32), ctypes.c_void_p,
+]
+_coreaudio_lib.AudioObjectGetPropertyData.restype = ctypes.c_int32
+_coreaudio_lib.AudioObjectSetPropertyData.argtypes = [
+    ctypes.c_uint32, ctypes.POINTER(AudioObjectPropertyAddress),
+    ctypes.c_uint32, ctypes.c_void_p, ctypes.c_uint32, ctypes.c_void_p,
+]
+_coreaudio_lib.AudioObjectSetPropertyData.restype = ctypes.c_int32
+
+
+def _fourcc(code):
+    return int.from_bytes(code.encode("ascii"), "big")
+
+
+kAudioObjectSystemObject = 1
+kAudioObjectPropertyElementMain = 0
+kAudioObjectPropertyScopeGlobal = _fourcc("glob")
+kAudioDevicePropertyScopeOutput = _fourcc("outp")
+kAudioHardwarePropertyDefaultOutputDevice = _fourcc("dOut")
+kAudioDevicePropertyMute = _fourcc("mute")
+# What the volume keys and "output volume" in AppleScript control
+kAudioHardwareServiceDeviceProperty_VirtualMainVolume = _fourcc("vmvc")
+
+
+def _ca_get(object_id, selector, scope, ctype):
+    """Read a fixed-size CoreAudio property; raises OSError on a non-zero status."""
+    addr = AudioObjectPropertyAddress(selector, scope, kAudioObjectPropertyElementMain)
+    value = ctype()
+    size = ctypes.c_uint32(ctypes.sizeof(value))
+    status = _coreaudio_lib.AudioObjectGetPropertyData(
+        object_id, ctypes.byref(addr), 0, None, ctypes.byref(size), ctypes.byref(value)
+    )
+    if status != 0:
+        raise OSError(status, "AudioObjectGetPropertyData failed")
+    return value.value
+
+
+def _ca_set(object_id, selector, scope, value):
+    """Write a fixed-size CoreAudio property (a ctypes instance)."""
+    addr = AudioObjectPropertyAddress(selector, scope, kAudioObjectPropertyElementMain)
+    status = _coreaudio_lib.AudioObjectSetPropertyData(
+        object_id, ctypes.byref(addr), 0, None, ctypes.sizeof(value), ctypes.byref(value)
+    )
+    if status != 0:
+        raise OSError(status, "AudioObjectSetPropertyData failed")
+
+
+def _default_output_device():
+    # Looked up per call (one cheap HAL read) so headphone switches are followed
+    return _ca_get(kAudioObjectSystemObject, kAudioHardwarePropertyDefaultOutputDevice,
+                   kAudioObjectPropertyScopeGlobal, ctypes.c_uint32)
+
 
 def get_system_volume():
     """Get current system output volume (0-100) and mute state."""
     try:
-        vol = subprocess.check_output(
-            ["osascript", "-e", "output volume of (get volume settings)"],
-            stderr=subprocess.DEVNULL,
-        ).decode().strip()
-        muted = subprocess.check_output(
-            ["osascript", "-e", "output muted of (get volume settings)"],
+        dev = _default_output_device()
+        vol = _ca_get(dev, kAudioHardwareServiceDeviceProperty_VirtualMainVolume,
+                      kAudioDevicePropertyScopeOutput, ctypes.c_float)
+        muted = _ca_get(dev, kAudioDevicePropertyMute,
+                        kAudioDevicePropertyScopeOutput, ctypes.c_uint32)
+        return round(vol * 100), bool(muted)
+    except Exception:
+        pass
+    try:
+        # One osascript process for both values
+        out = subprocess.check_output(
+            ["osascript",
+             "-e", "set s to get volume settings",
+             "-e", 'return (output volume of s as text) & "," & (output muted of s as text)'],
             stderr=subprocess.DEVNULL,
         ).decode().strip()
+        vol, muted = out.split(",")
         return int(vol), muted == "true"
     except Exception:
         return 50, False
 
 
 def set_system_volume(volume):
-    """Set macOS system output volume via osascript (hardcoded command)."""
+    """Set macOS system output volume (0-100)."""
+    try:
+        _ca_set(_default_output_device(), kAudioHardwareServiceDeviceProperty_VirtualMainVolume,
+                kAudioDevicePropertyScopeOutput, ctypes.c_float(volume / 100.0))
+        return
+    except Exception:
+        pass
     subprocess.run(
         ["osascript", "-e", f"set volume output volume {volume}"],
         stderr=subprocess.DEVNULL,
@@ -338,7 +489,13 @@ def set_system_volume(volume):
 
 
 def set_system_mute(muted):
-    """Set macOS system mute state via osascript (hardcoded command)."""
+    """Set macOS system mute state."""
+    try:
+        _ca_set(_default_output_device(), kAudioDevicePropertyMute,
+                kAudioDevicePropertyScopeOutput, ctypes.c_uint32(1 if muted else 0))
+        return
+    except Exception:
+        pass
     val = "true" if muted else "false"
     subprocess.run(
         ["osascript", "-e", f"set volume output muted {val}"],
@@ -352,11 +509,14 @@ class SpeechToType:
     def __init__(self, settings_path=DEFAULT_SETTINGS_PATH):
         self.model = None
         self.loaded_model_idx = None
+        self._queued_repo = None  # repo of the most recently queued load
         self._key_held = False
         self._recording = False
         self._recording_lock = threading.Lock()
         self._stream_active = False  # guards audio callback; stream stays open
-        self._chunks = []
+        # Preallocated recording buffer; the audio callback copies into it in place
+        self._audio_buf = np.empty(SAMPLE_RATE * AUDIO_BUFFER_SECONDS, dtype=np.float32)
+        self._audio_len = 0
         self._stream = None
         self._stream_device = None  # tracks which device the persistent stream uses
         self._recording_session = 0  # monotonic counter for log correlation
@@ -364,6 +524,10 @@ class SpeechToType:
         self._cb_last_log_time = 0   # last time we logged a heartbeat
         self._auto_stop_triggered = False  # one-shot latch for MAX_RECORDING_DURATION
 
+        # Shared AppKit singletons, looked up once instead of on every paste
+        self._workspace = AppKit.NSWorkspace.sharedWorkspace()
+        self._pasteboard = AppKit.NSPasteboard.generalPasteboard()
+
         # macOS target window state
         self._target_app = None
         self._target_app_ref = None
@@ -372,32 +536,51 @@ class SpeechToType:
         # CGEvent tap for global hotkeys
         self._tap_port = None
         self._tap_source = None
-        self._main_runloop = CFRunLoopGetCurrent()  # capture main thread's run loop
-
-        # Keystroke capture during paste
+        # keycode -> "hotkey" | "cancel" | "no_enter", rebuilt whenever the tap is installed
+        self._keycode_roles = {}
+        self._tap_runloop = None  # run loop of the "hotkey-tap" thread while installed
+        # Install/uninstall are called from the worker, the rebind path and tick_;
+        # reentrant because installing tears down the previous tap first
+        self._tap_lock = threading.RLock()
+
+        # Keystroke capture during paste. One private event source for the app's
+        # lifetime; the tap recognizes our synthetic events by its state ID.
         self._paste_capturing = False
-        self._paste_source_state_id = 0
-        self._captured_events = []
+        self._paste_source = CGEventSourceCreate(kCGEventSourceStatePrivate)
+        self._paste_source_state_id = CGEventSourceGetSourceStateID(self._paste_source)
+        # Preallocated slots; the tap fills them without growing a list
+        self._captured_events = [None] * MAX_CAPTURED_EVENTS
+        self._captured_count = 0
 
         # Menu bar status item for recording timer
         self._status_item = NSStatusBar.systemStatusBar().statusItemWithLength_(NSVariableStatusItemLength)
         self._status_item.button().setFont_(NSFont.monospacedDigitSystemFontOfSize_weight_(12, 0.0))
         self._status_item.button().setTitle_("")
         self._status_item_visible = False
+        self._menu_bar_text = None  # last text shown; skips no-op updates
         self._update_menu_bar("")  # hidden initially
 
         # Configurable settings
         self.input_devices = get_input_devices()
+        # PortAudio index / device name -> position in input_devices (first match wins)
+        self._device_pos_by_index = {}
+        self._device_pos_by_name = {}
+        for i, (idx, name) in enumerate(self.input_devices):
+            self._device_pos_by_index.setdefault(idx, i)
+            self._device_pos_by_name.setdefault(name, i)
         self.device_idx = 0
         self.hotkey = "f2"
         self.mode = "push"
         self.after_action = "enter"
         self.window_target = "original"
         self.model_idx = MODELS.index("turbo")
+        self.precision = "fp16"
         self.cancel_key = "f3"
         self.no_enter_key = "f4"
         self.deafen_while_recording = "off"
         self.settings_path = settings_path
+        self._settings_lock = threading.Lock()
+        self._saved_settings = None  # dict last read from / written to disk
         self._was_muted = False
         self._prev_volume = None
         self._skip_enter = False
@@ -408,21 +591,41 @@ class SpeechToType:
         self.status = "Loading model..."
         self.last_text = ""
         self.last_time = 0.0
+        self._wake_ui = None  # set by the GUI; called whenever a redraw is requested
         self._needs_redraw = True
         self._running = True
 
+        # Model loads and transcriptions run one at a time on a single worker thread
+        self._tasks = queue.Queue()
+        self._worker = threading.Thread(target=self._worker_loop, args=(self._tasks,),
+                                        name="worker", daemon=True)
+        self._worker.start()
+        # Start/stop from the hotkey tap and the audio callback, in arrival order,
+        # without spawning a thread per key press
+        self._commands = queue.Queue()
+        self._recorder = threading.Thread(target=self._worker_loop, args=(self._commands,),
+                                          name="recorder", daemon=True)
+        self._recorder.start()
+
         # Set default device to the system default input
         try:
-            default_idx = sd.default.device[0]
-            for i, (idx, name) in enumerate(self.input_devices):
-                if idx == default_idx:
-                    self.device_idx = i
-                    break
+            self.device_idx = self._device_pos_by_index.get(sd.default.device[0], self.device_idx)
         except Exception:
             pass
 
         self._load_settings()
 
+    @property
+    def _needs_redraw(self):
+        return self._redraw_requested
+
+    @_needs_redraw.setter
+    def _needs_redraw(self, value):
+        # Setting it from any thread wakes the GUI timer, which idles otherwise
+        self._redraw_requested = value
+        if value and self._wake_ui is not None:
+            self._wake_ui()
+
     # ── Settings persistence ────────────────────────────────
 
     def _load_settings(self):
@@ -431,26 +634,19 @@ class SpeechToType:
             return
         try:
             with open(path, "r") as f:
-                data = json5.load(f)
-            if "hotkey" in data:
-                self.hotkey = data["hotkey"] or None
-            if "mode" in data:
-                self.mode = data["mode"]
-            if "after_action" in data:
-                self.after_action = data["after_action"]
-            if "window_target" in data:
-                self.window_target = data["window_target"]
+                data = parse_settings(f.read())
+            for key in PLAIN_SETTINGS:
+                if key in data:
+                    setattr(self, key, data[key])
+            for key in KEY_SETTINGS:
+                if key in data:
+                    setattr(self, key, data[key] or None)
             if "model" in data and data["model"] in MODELS:
                 self.model_idx = MODELS.index(data["model"])
+            if "precision" in data and data["precision"] in PRECISIONS:
+                self.precision = data["precision"]
             if "device_name" in data:
-                for i, (idx, name) in enumerate(self.input_devices):
-                    if name == data["device_name"]:
-                        self.device_idx = i
-                        break
-            if "cancel_key" in data:
-                self.cancel_key = data["cancel_key"] or None
-            if "no_enter_key" in data:
-                self.no_enter_key = data["no_enter_key"] or None
+                self.device_idx = self._device_pos_by_name.get(data["device_name"], self.device_idx)
             if "deafen_while_recording" in data:
                 val = data["deafen_while_recording"]
                 if val in ("off", "half", "on"):
@@ -459,52 +655,83 @@ class SpeechToType:
                     self.deafen_while_recording = "on"
                 else:
                     self.deafen_while_recording = "off"
+            self._saved_settings = self._settings_dict()
         except Exception:
             pass
 
-    def _save_settings(self):
+    def _settings_dict(self):
+        """Current settings as the values written to disk."""
         dev_name = self.input_devices[self.device_idx][1] if self.input_devices else ""
+        return {
+            "hotkey": self.hotkey,
+            "mode": self.mode,
+            "after_action": self.after_action,
+            "window_target": self.window_target,
+            "model": MODELS[self.model_idx],
+            "precision": self.precision,
+            "device_name": dev_name,
+            "cancel_key": self.cancel_key,
+            "no_enter_key": self.no_enter_key,
+            "deafen_while_recording": self.deafen_while_recording,
+        }
+
+    def _save_settings(self):
+        with self._settings_lock:
+            data = self._settings_dict()
+            if data == self._saved_settings:
+                return  # every control action saves, even when nothing changed
+            self._write_settings(data)
+
+    def _write_settings(self, data):
         content = f"""\
 {{
   // Global hotkey to start/stop recording
   // Examples: "f2", "f5", "scroll_lock", "pause"
-  "hotkey": {json5.dumps(self.hotkey)},
+  "hotkey": {json.dumps(data["hotkey"])},
 
   // Recording mode: "push" (hold to record) or "toggle" (press to start/stop)
-  "mode": {json5.dumps(self.mode)},
+  "mode": {json.dumps(data["mode"])},
 
   // What happens after transcription is typed
   // "enter" = press Enter key (send message), "nothing" = just type the text
-  "after_action": {json5.dumps(self.after_action)},
+  "after_action": {json.dumps(data["after_action"])},
 
   // Where to type the transcription
   // "original" = window focused when recording started, "active" = currently focused window
-  "window_target": {json5.dumps(self.window_target)},
+  "window_target": {json.dumps(data["window_target"])},
 
   // Whisper model size: "tiny", "base", "small", "medium", "large"
   // Larger models are more accurate but slower and use more RAM
-  "model": {json5.dumps(MODELS[self.model_idx])},
+  "model": {json.dumps(data["model"])},
+
+  // Model weights: "fp16" (full precision) or "q4" (4-bit quantized)
+  // q4 is faster and uses about a quarter of the RAM, with slightly lower accuracy
+  "precision": {json.dumps(data["precision"])},
 
   // Audio input device name (must match a device on your system)
-  "device_name": {json5.dumps(dev_name)},
+  "device_name": {json.dumps(data["device_name"])},
 
   // Cancel key: cancels the current recording
-  "cancel_key": {json5.dumps(self.cancel_key)},
+  "cancel_key": {json.dumps(data["cancel_key"])},
 
   // Cancel but type key: stops recording and types without pressing Enter
-  "no_enter_key": {json5.dumps(self.no_enter_key)},
+  "no_enter_key": {json.dumps(data["no_enter_key"])},
 
   // Deafen (mute) system audio while recording to avoid picking up playback
-  "deafen_while_recording": {json5.dumps(self.deafen_while_recording)},
+  "deafen_while_recording": {json.dumps(data["deafen_while_recording"])},
 }}
 """
+        # Write to a temp file and swap it in so a crash never leaves a truncated file
+        tmp_path = self.settings_path + ".tmp"
         try:
-            with open(self.settings_path, "w") as f:
+            with open(tmp_path, "w") as f:
                 f.write(content)
+            os.replace(tmp_path, self.settings_path)
+            self._saved_settings = data
         except Exception:
             pass
 
-    # ── Audio deafen control (macOS via osascript) ──────────
+    # ── Audio deafen control (macOS via CoreAudio) ──────────
 
     def _mute_system(self):
         try:
@@ -544,7 +771,7 @@ class SpeechToType:
         keys through unmodified.  During the ~0.5 s paste window, non-synthetic
         keystrokes are buffered (not logged) and replayed immediately after.
         """
-        if event_type in (kCGEventTapDisabledByTimeout, kCGEventTapDisabledByUserInput):
+        if event_type in TAP_DISABLED_EVENTS:
             reason = "timeout" if event_type == kCGEventTapDisabledByTimeout else "user_input"
             _dlog(f"[tap] DISABLED by {reason}, recording={self._recording}, key_held={self._key_held}")
             if self._tap_port is not None:
@@ -557,25 +784,23 @@ class SpeechToType:
             event_source_id = CGEventGetIntegerValueField(event, 45)  # kCGEventSourceStateID
             if event_source_id == self._paste_source_state_id:
                 return event
-            if len(self._captured_events) < MAX_CAPTURED_EVENTS:
-                self._captured_events.append(CGEventCreateCopy(event))
+            n = self._captured_count
+            if n < MAX_CAPTURED_EVENTS:
+                self._captured_events[n] = CGEventCreateCopy(event)
+                self._captured_count = n + 1
             return None  # suppress
 
-        keycode = Quartz.CGEventGetIntegerValueField(
-            event, Quartz.kCGKeyboardEventKeycode
-        )
-        key_name = KEYCODE_TO_NAME.get(keycode)
-        if key_name is None:
+        # Nearly every event is some other key: one field read and one dict probe
+        keycode = CGEventGetIntegerValueField(event, kCGKeyboardEventKeycode)
+        role = self._keycode_roles.get(keycode)
+        if role is None:
             return event
 
         is_down = (event_type == kCGEventKeyDown)
         is_up = (event_type == kCGEventKeyUp)
 
-        def matches(setting):
-            return setting and key_name.lower() == setting.lower()
-
         # Record hotkey
-        if matches(self.hotkey):
+        if role == "hotkey":
             if is_down:
                 self._on_hotkey_event("down")
             elif is_up:
@@ -583,77 +808,118 @@ class SpeechToType:
             return None  # suppress
 
         # Cancel key
-        if matches(self.cancel_key):
+        if role == "cancel":
             if is_down:
                 self._on_cancel_event()
             return None
 
         # No-enter key
-        if matches(self.no_enter_key):
-            if is_down:
-                self._on_no_enter_event()
-            return None
-
-        return event
+        if is_down:
+            self._on_no_enter_event()
+        return None
 
     def _install_hotkey_tap(self):
-        """Create and install the global CGEvent tap on the main run loop.
+        """Create and install the global CGEvent tap on its own thread's run loop.
 
         Security: requires Accessibility permission; taps all key-down,
         key-up, and flags-changed events system-wide.
+
+        The callback only compares key codes and hands work to the recorder
+        queue, so it runs on a dedicated thread rather than waking the main
+        (AppKit) run loop for every keystroke, where slow UI work could also
+        get the tap disabled by timeout. Serialized with _tap_lock so two
+        callers can never leave two live taps.
         """
-        self._uninstall_hotkey_tap()
+        with self._tap_lock:
+            self._uninstall_hotkey_tap()
+
+            # Key settings only change while the tap is down (load, rebind, CLI).
+            # setdefault keeps the old precedence if two roles share a key.
+            roles = {}
+            unknown = []
+            for setting, role in ((self.hotkey, "hotkey"),
+                                  (self.cancel_key, "cancel"),
+                                  (self.no_enter_key, "no_enter")):
+                keycode = keycode_for_name(setting)
+                if keycode is not None:
+                    roles.setdefault(keycode, role)
+                elif setting:
+                    unknown.append(setting)
+            self._keycode_roles = roles
+
+            # Check accessibility permission explicitly and prompt if missing
+            if not _is_accessibility_trusted(prompt=False):
+                # Trigger the system prompt to grant accessibility
+                _is_accessibility_trusted(prompt=True)
+                self.status = "Grant Accessibility permission in System Settings, then restart"
+                self._needs_redraw = True
+                return
 
-        # Check accessibility permission explicitly and prompt if missing
-        if not _is_accessibility_trusted(prompt=False):
-            # Trigger the system prompt to grant accessibility
-            _is_accessibility_trusted(prompt=True)
-            self.status = "Grant Accessibility permission in System Settings, then restart"
-            self._needs_redraw = True
-            return
+            tap_mask = (1 << kCGEventKeyDown) | (1 << kCGEventKeyUp) | (1 << kCGEventFlagsChanged)
+            self._tap_port = CGEventTapCreate(
+                kCGHIDEventTap,
+                kCGHeadInsertEventTap,
+                kCGEventTapOptionDefault,
+                tap_mask,
+                self._hotkey_callback,
+                None,
+            )
+            if not self._tap_port:
+                self.status = "WARNING: no event tap (Accessibility granted but tap failed — try restarting)"
+                self._needs_redraw = True
+                return
 
-        tap_mask = (1 << kCGEventKeyDown) | (1 << kCGEventKeyUp) | (1 << kCGEventFlagsChanged)
-        self._tap_port = CGEventTapCreate(
-            kCGHIDEventTap,
-            kCGHeadInsertEventTap,
-            kCGEventTapOptionDefault,
-            tap_mask,
-            self._hotkey_callback,
-            None,
-        )
-        if not self._tap_port:
-            self.status = "WARNING: no event tap (Accessibility granted but tap failed — try restarting)"
-            self._needs_redraw = True
-            return
+            self._tap_source = CoreFoundation.CFMachPortCreateRunLoopSource(
+                None, self._tap_port, 0
+            )
+            tap_source = self._tap_source
+            ready = threading.Event()
 
-        self._tap_source = CoreFoundation.CFMachPortCreateRunLoopSource(
-            None, self._tap_port, 0
-        )
-        CoreFoundation.CFRunLoopAddSource(
-            self._main_runloop, self._tap_source, CoreFoundation.kCFRunLoopDefaultMode
-        )
-        CGEventTapEnable(self._tap_port, True)
+            def run_tap():
+                self._tap_runloop = CFRunLoopGetCurrent()
+                CoreFoundation.CFRunLoopAddSource(
+                    self._tap_runloop, tap_source, CoreFoundation.kCFRunLoopCommonModes
+                )
+                ready.set()
+                # Returns once _uninstall_hotkey_tap removes the source and stops the loop
+                CoreFoundation.CFRunLoopRun()
+
+            threading.Thread(target=run_tap, name="hotkey-tap", daemon=True).start()
+            ready.wait()
+            CGEventTapEnable(self._tap_port, True)
+
+            # A typo'd key in settings.json5 would otherwise just never fire
+            if unknown:
+                _dlog(f"[tap] unknown key names: {unknown}")
+                self.status = f"Unknown key in settings: {', '.join(unknown)}"
+                self._needs_redraw = True
 
     def _uninstall_hotkey_tap(self):
-        if self._tap_port:
+        with self._tap_lock:
+            if not self._tap_port:
+                return
             CGEventTapEnable(self._tap_port, False)
             if self._tap_source:
                 CoreFoundation.CFRunLoopRemoveSource(
-                    self._main_runloop,
+                    self._tap_runloop,
                     self._tap_source,
-                    CoreFoundation.kCFRunLoopDefaultMode,
+                    CoreFoundation.kCFRunLoopCommonModes,
                 )
+                CoreFoundation.CFRunLoopStop(self._tap_runloop)
                 self._tap_source = None
+                self._tap_runloop = None
+            # Release the mach port now rather than whenever the wrapper is collected
+            CoreFoundation.CFMachPortInvalidate(self._tap_port)
             self._tap_port = None
 
-    def _pump_runloop(self, seconds=0.01):
-        """Pump the main CFRunLoop so CGEvent tap callbacks fire."""
-        CFRunLoopRunInMode(CoreFoundation.kCFRunLoopDefaultMode, seconds, False)
-
     # ── Menu bar timer ─────────────────────────────────────
 
     def _update_menu_bar(self, text):
         """Show or hide the menu bar status item."""
+        # The timer shows whole seconds but ticks at 10 Hz; only touch AppKit on change
+        if text == self._menu_bar_text:
+            return
+        self._menu_bar_text = text
         if text:
             self._status_item.setVisible_(True)
             self._status_item.button().setTitle_(text)
@@ -673,14 +939,47 @@ class SpeechToType:
 
     # ── Core logic ──────────────────────────────────────────
 
+    def _selected_repo(self):
+        """Hugging Face repo for the selected model and precision."""
+        repos = MLX_MODEL_REPOS_Q4 if self.precision == "q4" else MLX_MODEL_REPOS
+        return repos[MODELS[self.model_idx]]
+
     def load_model(self):
         model_name = MODELS[self.model_idx]
-        repo = MLX_MODEL_REPOS[model_name]
+        repo = self._selected_repo()
         self.status = f"Loading whisper '{model_name}' (MLX)..."
         self._needs_redraw = True
+        t0 = time.perf_counter()
+        try:
+            # Imported here: MLX initializes Metal on import, which shouldn't delay the window
+            import mlx.core as mx
+            import mlx_whisper
+            from mlx_whisper.transcribe import ModelHolder
+
+            # transcribe() keeps the last model in ModelHolder keyed by repo and
+            # dtype, so loading through it is what the first real call reuses
+            model = ModelHolder.get_model(repo, mx.float16)
+            # MLX is lazy; force the weights into memory now
+            mx.eval(model.parameters())
+
+            # Compile the encoder/decoder kernels before the first hotkey press
+            self.status = f"Warming up '{model_name}' (MLX)..."
+            self._needs_redraw = True
+            mlx_whisper.transcribe(
+                np.zeros(SAMPLE_RATE, dtype=np.float32), path_or_hf_repo=repo, language="en"
+            )
+        except Exception as e:
+            _dlog(f"[load_model] FAILED: {e}")
+            if self._queued_repo == repo:
+                self._queued_repo = None  # let Reload retry it
+            self.status = f"Model load failed: {e}"
+            self._needs_redraw = True
+            return
+        elapsed = time.perf_counter() - t0
+        _dlog(f"[load_model] {repo} ready in {elapsed:.1f}s")
         self.model = repo
         self.loaded_model_idx = self.model_idx
-        self.status = f"Ready ({model_name})"
+        self.status = f"Ready ({model_name}, loaded in {elapsed:.1f}s)"
         self._needs_redraw = True
 
     def _ready_status(self):
@@ -692,7 +991,7 @@ class SpeechToType:
         return (f"recording={self._recording} stream_active={self._stream_active} "
                 f"key_held={self._key_held} start_time_set={self._record_start_time is not None} "
                 f"auto_stop={self._auto_stop_triggered} cb_count={self._cb_count} "
-                f"chunks={len(self._chunks)} stream={self._stream is not None}")
+                f"samples={self._audio_len} stream={self._stream is not None}")
 
     def _audio_callback(self, indata, frames, time_info, status):
         if not self._stream_active:
@@ -712,17 +1011,22 @@ class SpeechToType:
         if now - self._cb_last_log_time >= 5.0:
             elapsed = now - self._record_start_time if self._record_start_time else 0
             _dlog(f"[audio_cb] s{self._recording_session} heartbeat: "
-                  f"cb_count={self._cb_count} chunks={len(self._chunks)} "
+                  f"cb_count={self._cb_count} samples={self._audio_len} "
                   f"elapsed={elapsed:.1f}s frames={frames}")
             self._cb_last_log_time = now
-        self._chunks.append(indata.copy())
+        # Single producer: only this callback advances _audio_len while active.
+        # Never allocate on the audio thread; anything past the slack is dropped.
+        start = self._audio_len
+        n = min(frames, self._audio_buf.size - start)
+        np.copyto(self._audio_buf[start:start + n], indata[:n, 0])
+        self._audio_len = start + n
         if (self._record_start_time and not self._auto_stop_triggered
                 and (now - self._record_start_time) >= MAX_RECORDING_DURATION):
             self._auto_stop_triggered = True
             elapsed = now - self._record_start_time
             _dlog(f"[audio_cb] s{self._recording_session} MAX_RECORDING_DURATION reached at "
                   f"{elapsed:.2f}s, triggering stop | {self._debug_state()}")
-            threading.Thread(target=self._stop_recording, daemon=True).start()
+            self._commands.put(self._stop_recording)
 
     def _ensure_stream(self):
         """Create the audio stream once and reuse it across recordings.
@@ -800,19 +1104,19 @@ class SpeechToType:
                 if self._key_held:
                     return
                 self._key_held = True
-                threading.Thread(target=self._start_recording, daemon=True).start()
+                self._commands.put(self._start_recording)
             else:
                 self._key_held = False
-                threading.Thread(target=self._stop_recording, daemon=True).start()
+                self._commands.put(self._stop_recording)
         else:  # toggle
             if direction == "down":
                 if self._key_held:
                     return
                 self._key_held = True
                 if self._recording:
-                    threading.Thread(target=self._stop_recording, daemon=True).start()
+                    self._commands.put(self._stop_recording)
                 else:
-                    threading.Thread(target=self._start_recording, daemon=True).start()
+                    self._commands.put(self._start_recording)
             else:
                 self._key_held = False
 
@@ -827,7 +1131,7 @@ class SpeechToType:
         self._record_start_time = None
         self._auto_stop_triggered = False
         self._stream_active = False  # callback becomes a no-op; stream stays open
-        self._chunks = []
+        self._audio_len = 0
         _dlog(f"[cancel] s{sid} deactivated | {self._debug_state()}")
         if self.deafen_while_recording != "off":
             self._unmute_system()
@@ -840,12 +1144,11 @@ class SpeechToType:
             self._skip_enter = True
             self._cancel_type_used = True
             self._key_held = False
-            threading.Thread(target=self._stop_recording, daemon=True).start()
+            self._commands.put(self._stop_recording)
 
     def _capture_target_window(self):
         """Capture the currently focused app/window as the typing target."""
-        workspace = AppKit.NSWorkspace.sharedWorkspace()
-        self._target_app = workspace.frontmostApplication()
+        self._target_app = self._workspace.frontmostApplication()
         if self._target_app:
             pid = self._target_app.processIdentifier()
             self._target_app_ref, self._target_window_ref = get_ax_focused_window(pid)
@@ -860,7 +1163,7 @@ class SpeechToType:
                 return
             self._recording = True
         self._skip_enter = False
-        self._chunks = []
+        self._audio_len = 0
         self._cb_count = 0
         self._cb_last_log_time = 0
         self._auto_stop_triggered = False
@@ -919,30 +1222,47 @@ class SpeechToType:
         if self.deafen_while_recording != "off":
             self._unmute_system()
 
-        if not self._chunks:
-            _dlog("[stop_recording] no chunks, done")
+        if not self._audio_len:
+            _dlog("[stop_recording] no audio, done")
             self.status = self._ready_status()
             self._needs_redraw = True
             return
 
-        audio = np.concatenate(self._chunks, axis=0).flatten()
+        # View for the checks below; copied out only if it gets transcribed
+        audio = self._audio_buf[:self._audio_len]
         duration = len(audio) / SAMPLE_RATE
-        _dlog(f"[stop_recording] chunks={len(self._chunks)} duration={duration:.2f}s")
+        _dlog(f"[stop_recording] samples={len(audio)} duration={duration:.2f}s")
 
         if duration < MIN_AUDIO_DURATION:
             self.status = "Too short, skipped"
             self._needs_redraw = True
             return
 
+        # Whisper pads every window to 30s, so a silent clip costs a full encoder pass
+        rms = float(np.sqrt(np.dot(audio, audio) / len(audio)))
+        if rms < SILENCE_RMS_THRESHOLD:
+            _dlog(f"[stop_recording] rms={rms:.5f} below threshold, skipping")
+            self.status = "Silence, skipped"
+            self._needs_redraw = True
+            return
+
+        # Copy out so the next recording can reuse the buffer; the MLX
+        # conversion happens on the worker, the only thread that touches MLX
+        audio = audio.copy()
+
         self.status = f"Transcribing {duration:.1f}s of audio..."
         self._needs_redraw = True
-        _dlog("[stop_recording] spawning transcribe thread")
-        threading.Thread(target=self._transcribe_and_type, args=(audio,), daemon=True).start()
+        _dlog("[stop_recording] queueing transcription")
+        self._tasks.put(functools.partial(self._transcribe_and_type, audio))
 
     def _transcribe_and_type(self, audio):
-        _dlog(f"[transcribe] starting, audio length={len(audio)/SAMPLE_RATE:.2f}s")
+        _dlog(f"[transcribe] starting, audio length={audio.size/SAMPLE_RATE:.2f}s")
         t0 = time.perf_counter()
         try:
+            import mlx.core as mx
+            import mlx_whisper  # already loaded by load_model
+            # mlx_whisper takes an mx.array as-is instead of converting the numpy clip
+            audio = mx.array(audio)
             result = mlx_whisper.transcribe(
                 audio, path_or_hf_repo=self.model, language="en"
             )
@@ -983,12 +1303,13 @@ class SpeechToType:
         Security: reads the frontmost application identity and its focused
         window via AXUIElement.
 
-        Returns (workspace, return_to_app, return_to_app_ref,
-                 return_to_window_ref, target_app, target_window_ref)
-        or None if there is no valid target.
+        Returns (return_to_app, return_to_app_ref, return_to_window_ref,
+                 target_app, target_app_ref, target_window_ref)
+        or None if there is no valid target.  The target's AX refs are the
+        ones captured at record start (or just now, for "active"), so the
+        switch doesn't query accessibility again.
         """
-        workspace = AppKit.NSWorkspace.sharedWorkspace()
-        return_to_app = workspace.frontmostApplication()
+        return_to_app = self._workspace.frontmostApplication()
         return_to_app_ref = None
         return_to_window_ref = None
         if return_to_app:
@@ -997,9 +1318,11 @@ class SpeechToType:
 
         if self.window_target == "active":
             target_app = return_to_app
+            target_app_ref = return_to_app_ref
             target_window_ref = return_to_window_ref
         else:
             target_app = self._target_app
+            target_app_ref = self._target_app_ref
             target_window_ref = self._target_window_ref
         if not target_app:
             return None
@@ -1014,23 +1337,26 @@ class SpeechToType:
                         f" window_title={rt_win_title}\n")
         _log_file.flush()
 
-        return (workspace, return_to_app, return_to_app_ref,
-                return_to_window_ref, target_app, target_window_ref)
+        return (return_to_app, return_to_app_ref, return_to_window_ref,
+                target_app, target_app_ref, target_window_ref)
 
     def _save_and_set_clipboard(self, text):
         """Save old clipboard contents and set clipboard to *text*.
 
         Security: reads and writes the system clipboard.
 
-        Returns (pb, old_clipboard) for later restoration.
+        Returns old_clipboard for later restoration.
         """
-        pb = AppKit.NSPasteboard.generalPasteboard()
-        old_clipboard = pb.stringForType_(NSPasteboardTypeString)
+        pb = self._pasteboard
+        # Raw UTF-8 NSData both ways: no NSString round-trip for the text or the saved copy
+        old_clipboard = pb.dataForType_(NSPasteboardTypeString)
         pb.clearContents()
-        pb.setString_forType_(text, NSPasteboardTypeString)
-        return pb, old_clipboard
+        encoded = text.encode("utf-8")
+        pb.setData_forType_(AppKit.NSData.dataWithBytes_length_(encoded, len(encoded)),
+                            NSPasteboardTypeString)
+        return old_clipboard
 
-    def _switch_to_target_window(self, workspace, target_app, target_window_ref,
+    def _switch_to_target_window(self, target_app, target_app_ref, target_window_ref,
                                   return_to_window_ref):
         """Activate the target app/window, waiting for the switch to complete.
 
@@ -1039,9 +1365,8 @@ class SpeechToType:
 
         Returns (needs_switch, needs_window_raise).
         """
-        _rl = CoreFoundation.kCFRunLoopDefaultMode
         target_pid = target_app.processIdentifier()
-        front = workspace.frontmostApplication()
+        front = self._workspace.frontmostApplication()
         same_app = front and front.processIdentifier() == target_pid
         needs_switch = not same_app
         needs_window_raise = (same_app and target_window_ref
@@ -1054,58 +1379,84 @@ class SpeechToType:
         _log_file.flush()
 
         if needs_switch:
-            target_app_ref, _ = get_ax_focused_window(target_pid)
-            target_app.activateWithOptions_(0)
-            # Raise the specific window immediately after activation request
-            if target_window_ref:
-                ax_raise_window(target_window_ref)
-                if target_app_ref:
-                    ax_set_focused_window(target_app_ref, target_window_ref)
-            # Poll until macOS confirms the switch
-            for i in range(WINDOW_SWITCH_MAX_POLLS):
-                CFRunLoopRunInMode(_rl, WINDOW_SWITCH_POLL_INTERVAL, False)
-                front = workspace.frontmostApplication()
-                if front and front.processIdentifier() == target_pid:
-                    _log_file.write(f"[switch] target switch confirmed after {i+1} polls\n")
-                    _log_file.flush()
-                    break
-            # Verify switch actually happened; fall back to osascript if not
-            front = workspace.frontmostApplication()
-            if not front or front.processIdentifier() != target_pid:
-                _log_file.write(f"[switch] activateWithOptions_ failed"
-                                f" (front={front.localizedName() if front else 'None'}"
-                                f" pid={front.processIdentifier() if front else 0}),"
-                                f" falling back to osascript\n")
+            def raise_target():
+                # Raise the specific window immediately after activation request
+                if target_window_ref:
+                    ax_raise_window(target_window_ref)
+                    if target_app_ref:
+                        ax_set_focused_window(target_app_ref, target_window_ref)
+
+            waited = self._activate_and_wait(target_app, raise_target, WINDOW_SWITCH_TIMEOUT)
+            if waited is not None:
+                _log_file.write(f"[switch] target switch confirmed after {waited * 1000:.0f}ms\n")
                 _log_file.flush()
-                bundle_id = target_app.bundleIdentifier()
-                if bundle_id:
-                    subprocess.run(
-                        ["osascript", "-e",
-                         f'tell application id "{bundle_id}" to activate'],
-                        stderr=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
-                        timeout=3,
-                    )
-                    CFRunLoopRunInMode(_rl, POST_SWITCH_SETTLE, False)
-                    # Re-raise specific window after osascript activate
-                    if target_window_ref:
-                        ax_raise_window(target_window_ref)
-                        if target_app_ref:
-                            ax_set_focused_window(target_app_ref, target_window_ref)
-                    front = workspace.frontmostApplication()
-                    if front and front.processIdentifier() == target_pid:
-                        _log_file.write("[switch] osascript fallback succeeded\n")
-                    else:
-                        _log_file.write("[switch] osascript fallback also failed\n")
+            else:
+                # No activation notification: check the front app, fall back to osascript
+                front = self._workspace.frontmostApplication()
+                if not front or front.processIdentifier() != target_pid:
+                    _log_file.write(f"[switch] activateWithOptions_ failed"
+                                    f" (front={front.localizedName() if front else 'None'}"
+                                    f" pid={front.processIdentifier() if front else 0}),"
+                                    f" falling back to osascript\n")
                     _log_file.flush()
+                    bundle_id = target_app.bundleIdentifier()
+                    if bundle_id:
+                        subprocess.run(
+                            ["osascript", "-e",
+                             f'tell application id "{bundle_id}" to activate'],
+                            stderr=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                            timeout=3,
+                        )
+                        time.sleep(POST_SWITCH_SETTLE)
+                        # Re-raise specific window after osascript activate
+                        if target_window_ref:
+                            ax_raise_window(target_window_ref)
+                            if target_app_ref:
+                                ax_set_focused_window(target_app_ref, target_window_ref)
+                        front = self._workspace.frontmostApplication()
+                        if front and front.processIdentifier() == target_pid:
+                            _log_file.write("[switch] osascript fallback succeeded\n")
+                        else:
+                            _log_file.write("[switch] osascript fallback also failed\n")
+                        _log_file.flush()
         elif needs_window_raise:
-            target_app_ref, _ = get_ax_focused_window(target_pid)
             ax_raise_window(target_window_ref)
             if target_app_ref:
                 ax_set_focused_window(target_app_ref, target_window_ref)
-        CFRunLoopRunInMode(_rl, POST_SWITCH_SETTLE, False)
+        time.sleep(POST_SWITCH_SETTLE)
 
         return needs_switch, needs_window_raise
 
+    def _activate_and_wait(self, app, raise_window, timeout):
+        """Activate *app*, call *raise_window*, and wait for macOS to confirm.
+
+        Security: activates a cross-process application.  Wakes on
+        NSWorkspaceDidActivateApplicationNotification (posted on the main
+        thread) rather than polling frontmostApplication or sleeping a
+        fixed delay.  Returns the seconds waited, or None on timeout.
+        """
+        pid = app.processIdentifier()
+        activated = threading.Event()
+
+        def on_activate(note):
+            activated_app = note.userInfo()[AppKit.NSWorkspaceApplicationKey]
+            if activated_app is not None and activated_app.processIdentifier() == pid:
+                activated.set()
+
+        center = self._workspace.notificationCenter()
+        observer = center.addObserverForName_object_queue_usingBlock_(
+            AppKit.NSWorkspaceDidActivateApplicationNotification, None, None, on_activate
+        )
+        try:
+            t0 = time.perf_counter()
+            app.activateWithOptions_(0)
+            raise_window()
+            if activated.wait(timeout):
+                return time.perf_counter() - t0
+            return None
+        finally:
+            center.removeObserver_(observer)
+
     def _paste_and_enter(self, src):
         """Post synthetic Cmd+V and (optionally) Enter key events.
 
@@ -1117,25 +1468,25 @@ class SpeechToType:
         down = CGEventCreateKeyboardEvent(src, 0x09, True)
         CGEventSetFlags(down, kCGEventFlagMaskCommand)
         CGEventPost(kCGHIDEventTap, down)
-        self._pump_runloop_for(PASTE_KEY_DOWN_DELAY)
+        time.sleep(PASTE_KEY_DOWN_DELAY)
         up = CGEventCreateKeyboardEvent(src, 0x09, False)
         CGEventSetFlags(up, kCGEventFlagMaskCommand)
         CGEventPost(kCGHIDEventTap, up)
 
         # Optionally press Enter
         if self.after_action == "enter" and not self._skip_enter:
-            self._pump_runloop_for(PASTE_PRE_ENTER_DELAY)
+            time.sleep(PASTE_PRE_ENTER_DELAY)
             down = CGEventCreateKeyboardEvent(src, 0x24, True)
             CGEventSetFlags(down, 0)
             CGEventPost(kCGHIDEventTap, down)
-            self._pump_runloop_for(ENTER_KEY_DOWN_DELAY)
+            time.sleep(ENTER_KEY_DOWN_DELAY)
             up = CGEventCreateKeyboardEvent(src, 0x24, False)
             CGEventSetFlags(up, 0)
             CGEventPost(kCGHIDEventTap, up)
 
-        self._pump_runloop_for(PASTE_SETTLE_DELAY)
+        time.sleep(PASTE_SETTLE_DELAY)
 
-    def _switch_back_and_replay(self, workspace, return_to_app, return_to_app_ref,
+    def _switch_back_and_replay(self, return_to_app, return_to_app_ref,
                                  return_to_window_ref, needs_switch, needs_window_raise):
         """Return to the original window and replay buffered keystrokes.
 
@@ -1153,78 +1504,94 @@ class SpeechToType:
                             f" needs_switch={needs_switch} needs_raise={needs_window_raise}\n")
             _log_file.flush()
 
+            def raise_return():
+                # Raise the specific window
+                if return_to_window_ref:
+                    ax_raise_window(return_to_window_ref)
+                    if return_to_app_ref:
+                        ax_set_focused_window(return_to_app_ref, return_to_window_ref)
+
+            confirmed = False
             if needs_switch:
-                return_to_app.activateWithOptions_(0)
-            # Raise the specific window
-            if return_to_window_ref:
-                ax_raise_window(return_to_window_ref)
-                if return_to_app_ref:
-                    ax_set_focused_window(return_to_app_ref, return_to_window_ref)
-            self._pump_runloop_for(SWITCH_BACK_DELAY)
-
-            # Verify switch actually happened; fall back to osascript if not
-            front = workspace.frontmostApplication()
-            front_pid = front.processIdentifier() if front else 0
-            if front_pid != return_to_pid:
-                _log_file.write(f"[switch-back] activateWithOptions_ failed"
-                                f" (front={front.localizedName() if front else 'None'} pid={front_pid}),"
-                                f" falling back to osascript\n")
-                _log_file.flush()
-                bundle_id = return_to_app.bundleIdentifier()
-                if bundle_id:
-                    subprocess.run(
-                        ["osascript", "-e",
-                         f'tell application id "{bundle_id}" to activate'],
-                        stderr=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
-                        timeout=3,
-                    )
-                    self._pump_runloop_for(SWITCH_BACK_DELAY)
-                    # Re-raise specific window after osascript activate
-                    if return_to_window_ref:
-                        ax_raise_window(return_to_window_ref)
-                        if return_to_app_ref:
-                            ax_set_focused_window(return_to_app_ref, return_to_window_ref)
-                    self._pump_runloop_for(POST_SWITCH_SETTLE)
-                    front = workspace.frontmostApplication()
-                    front_pid = front.processIdentifier() if front else 0
-                    _log_file.write(f"[switch-back] after osascript:"
-                                    f" front={front.localizedName() if front else 'None'}"
-                                    f" pid={front_pid} success={front_pid == return_to_pid}\n")
+                # Continue once macOS reports the app active, plus a short settle
+                # for the window raise, instead of always waiting SWITCH_BACK_DELAY
+                waited = self._activate_and_wait(return_to_app, raise_return, WINDOW_SWITCH_TIMEOUT)
+                confirmed = waited is not None
+                if confirmed:
+                    _log_file.write(f"[switch-back] activation confirmed after {waited * 1000:.0f}ms\n")
                     _log_file.flush()
+                time.sleep(POST_SWITCH_SETTLE)
             else:
-                _log_file.write(f"[switch-back] activate succeeded\n")
-                _log_file.flush()
+                raise_return()
+                time.sleep(SWITCH_BACK_DELAY)
+
+            if not confirmed:
+                # No activation notification: check the front app, fall back to osascript
+                front = self._workspace.frontmostApplication()
+                front_pid = front.processIdentifier() if front else 0
+                if front_pid != return_to_pid:
+                    _log_file.write(f"[switch-back] activateWithOptions_ failed"
+                                    f" (front={front.localizedName() if front else 'None'} pid={front_pid}),"
+                                    f" falling back to osascript\n")
+                    _log_file.flush()
+                    bundle_id = return_to_app.bundleIdentifier()
+                    if bundle_id:
+                        subprocess.run(
+                            ["osascript", "-e",
+                             f'tell application id "{bundle_id}" to activate'],
+                            stderr=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                            timeout=3,
+                        )
+                        time.sleep(SWITCH_BACK_DELAY)
+                        # Re-raise specific window after osascript activate
+                        if return_to_window_ref:
+                            ax_raise_window(return_to_window_ref)
+                            if return_to_app_ref:
+                                ax_set_focused_window(return_to_app_ref, return_to_window_ref)
+                        time.sleep(POST_SWITCH_SETTLE)
+                        front = self._workspace.frontmostApplication()
+                        front_pid = front.processIdentifier() if front else 0
+                        _log_file.write(f"[switch-back] after osascript:"
+                                        f" front={front.localizedName() if front else 'None'}"
+                                        f" pid={front_pid} success={front_pid == return_to_pid}\n")
+                        _log_file.flush()
+                else:
+                    _log_file.write(f"[switch-back] activate succeeded\n")
+                    _log_file.flush()
 
         self._paste_capturing = False
-        self._pump_runloop_for(PRE_REPLAY_DELAY)
-        for evt in self._captured_events:
+        time.sleep(PRE_REPLAY_DELAY)
+        events = self._captured_events
+        for i in range(self._captured_count):
+            if i:
+                time.sleep(KEYSTROKE_REPLAY_INTERVAL)  # only between keystrokes
+            # Release each copy as soon as it is posted
+            evt, events[i] = events[i], None
             CGEventPost(kCGHIDEventTap, evt)
-            time.sleep(KEYSTROKE_REPLAY_INTERVAL)
-        self._captured_events.clear()
+        self._captured_count = 0
+
+    def _clear_captured_events(self):
+        """Drop buffered keystrokes, releasing the event copies but keeping the slots."""
+        n = self._captured_count
+        self._captured_count = 0
+        self._captured_events[:n] = [None] * n
 
-    def _restore_clipboard(self, pb, old_clipboard):
+    def _restore_clipboard(self, old_clipboard, pasted_at=None):
         """Restore the original clipboard contents (best-effort).
 
         Security: writes the system clipboard.
-        """
-        if old_clipboard is not None:
-            self._pump_runloop_for(CLIPBOARD_RESTORE_DELAY)
-            pb.clearContents()
-            pb.setString_forType_(old_clipboard, NSPasteboardTypeString)
 
-    def _pump_runloop_for(self, seconds):
-        """Pump CFRunLoop for *seconds*, processing event tap callbacks.
-
-        Security: processes pending CGEvent tap callbacks during the wait.
-        Uses short iterations so synthetic events are delivered promptly.
+        The restore delay counts from *pasted_at* (monotonic), so time spent
+        switching back and replaying keystrokes is not waited out twice.
         """
-        _rl = CoreFoundation.kCFRunLoopDefaultMode
-        deadline = time.monotonic() + seconds
-        while time.monotonic() < deadline:
-            CFRunLoopRunInMode(_rl, PUMP_INTERVAL, False)
-            remaining = deadline - time.monotonic()
-            if remaining > PUMP_SLEEP:
-                time.sleep(PUMP_SLEEP)
+        if old_clipboard is not None:
+            delay = CLIPBOARD_RESTORE_DELAY
+            if pasted_at is not None:
+                delay -= time.monotonic() - pasted_at
+            if delay > 0:
+                time.sleep(delay)
+            self._pasteboard.clearContents()
+            self._pasteboard.setData_forType_(old_clipboard, NSPasteboardTypeString)
 
     def _type_text_into_target(self, text):
         """Orchestrate the full paste workflow.
@@ -1239,37 +1606,37 @@ class SpeechToType:
         if targets is None:
             _dlog("[type_into_target] _resolve_paste_targets returned None, aborting")
             return
-        (workspace, return_to_app, return_to_app_ref,
-         return_to_window_ref, target_app, target_window_ref) = targets
+        (return_to_app, return_to_app_ref, return_to_window_ref,
+         target_app, target_app_ref, target_window_ref) = targets
 
         _log_file.write(f"[paste] target_app={target_app.localizedName()} pid={target_app.processIdentifier()}"
                         f" target_window={target_window_ref is not None}"
                         f" return_to={return_to_app.localizedName() if return_to_app else None}\n")
         _log_file.flush()
 
-        pb, old_clipboard = self._save_and_set_clipboard(text)
+        old_clipboard = self._save_and_set_clipboard(text)
 
-        # Create a private event source and start keystroke capture
-        src = CGEventSourceCreate(kCGEventSourceStatePrivate)
-        self._paste_source_state_id = CGEventSourceGetSourceStateID(src)
-        self._captured_events.clear()
+        # Start keystroke capture
+        self._clear_captured_events()
         self._paste_capturing = True
 
+        pasted_at = None
         try:
             needs_switch, needs_window_raise = self._switch_to_target_window(
-                workspace, target_app, target_window_ref, return_to_window_ref)
+                target_app, target_app_ref, target_window_ref, return_to_window_ref)
 
-            self._paste_and_enter(src)
+            self._paste_and_enter(self._paste_source)
+            pasted_at = time.monotonic()
 
             self._switch_back_and_replay(
-                workspace, return_to_app, return_to_app_ref,
+                return_to_app, return_to_app_ref,
                 return_to_window_ref, needs_switch, needs_window_raise)
         finally:
             # Guarantee cleanup even if an exception occurs mid-workflow
             self._paste_capturing = False
-            self._captured_events.clear()
+            self._clear_captured_events()
             try:
-                self._restore_clipboard(pb, old_clipboard)
+                self._restore_clipboard(old_clipboard, pasted_at)
             except Exception:
                 pass  # best-effort clipboard restore
 
@@ -1284,44 +1651,47 @@ class SpeechToType:
         "turbo":  "whisper-turbo (MLX) — Fast distilled large model. Recommended — near-large accuracy at much higher speed.",
     }
 
+    # Rows whose text never changes
+    STATIC_INFO = {
+        0: f"vibe-code-mic v{VERSION} (macOS). Local speech recognition powered by Whisper via MLX (Apple Silicon GPU). All processing happens on your machine — no data is sent to the cloud.",
+        3: "Global hotkey to start/stop recording. Click to rebind, then press any key to set it as the new hotkey.",
+        4: "A single tap during recording cancels it. Audio is discarded and nothing is typed. In toggle mode, press this before pressing the record key again.",
+        5: "A single tap during recording stops it and types the text without pressing Enter. Useful when you want to edit the text before sending.",
+    }
+
+    # Rows whose text follows a setting: row -> (attribute, fallback value, value -> text)
+    SETTING_INFO = {
+        6: ("mode", "toggle", {
+            "push":   "Push to hold: hold the key to record, release to stop and transcribe. Good for quick voice commands.",
+            "toggle": "Toggle: press once to start recording, press again to stop and transcribe. Good for longer dictation.",
+        }),
+        7: ("after_action", "nothing", {
+            "enter":   "Presses Enter after typing the transcription. Useful for sending messages in chat apps.",
+            "nothing": "Just types the text with no Enter key pressed after. Useful for filling in text fields or documents.",
+        }),
+        8: ("window_target", "active", {
+            "original": "Types into the window that was focused when you started recording, even if you switch apps during transcription.",
+            "active":   "Types into whatever window is active when transcription finishes. The target may change if you switch apps.",
+        }),
+        9: ("deafen_while_recording", "off", {
+            "on":   "System audio will be fully muted while recording and restored when you stop. Prevents your speakers from being picked up by the mic.",
+            "half": "System audio volume will be reduced by 50% while recording and restored when you stop. Reduces speaker bleed without losing all audio.",
+            "off":  "System audio stays on during recording. Enable this if your microphone picks up sounds from your speakers.",
+        }),
+    }
+
     def _get_description(self, selected):
-        if selected == 0:
-            return f"vibe-code-mic v{VERSION} (macOS). Local speech recognition powered by Whisper via MLX (Apple Silicon GPU). All processing happens on your machine — no data is sent to the cloud."
-        elif selected == 1:
+        if selected in self.STATIC_INFO:
+            return self.STATIC_INFO[selected]
+        if selected in self.SETTING_INFO:
+            attr, fallback, texts = self.SETTING_INFO[selected]
+            return texts.get(getattr(self, attr), texts[fallback])
+        if selected == 1:
             if self.input_devices:
                 return "Input device for recording. Choose from available microphones and audio inputs on your system."
             return "No input devices found."
-        elif selected == 2:
-            model_name = MODELS[self.model_idx]
-            return self.MODEL_INFO.get(model_name, "")
-        elif selected == 3:
-            return "Global hotkey to start/stop recording. Click to rebind, then press any key to set it as the new hotkey."
-        elif selected == 4:
-            return "A single tap during recording cancels it. Audio is discarded and nothing is typed. In toggle mode, press this before pressing the record key again."
-        elif selected == 5:
-            return "A single tap during recording stops it and types the text without pressing Enter. Useful when you want to edit the text before sending."
-        elif selected == 6:
-            if self.mode == "push":
-                return "Push to hold: hold the key to record, release to stop and transcribe. Good for quick voice commands."
-            else:
-                return "Toggle: press once to start recording, press again to stop and transcribe. Good for longer dictation."
-        elif selected == 7:
-            if self.after_action == "enter":
-                return "Presses Enter after typing the transcription. Useful for sending messages in chat apps."
-            else:
-                return "Just types the text with no Enter key pressed after. Useful for filling in text fields or documents."
-        elif selected == 8:
-            if self.window_target == "original":
-                return "Types into the window that was focused when you started recording, even if you switch apps during transcription."
-            else:
-                return "Types into whatever window is active when transcription finishes. The target may change if you switch apps."
-        elif selected == 9:
-            if self.deafen_while_recording == "on":
-                return "System audio will be fully muted while recording and restored when you stop. Prevents your speakers from being picked up by the mic."
-            elif self.deafen_while_recording == "half":
-                return "System audio volume will be reduced by 50% while recording and restored when you stop. Reduces speaker bleed without losing all audio."
-            else:
-                return "System audio stays on during recording. Enable this if your microphone picks up sounds from your speakers."
+        if selected == 2:
+            return self.MODEL_INFO.get(MODELS[self.model_idx], "")
         return ""
 
     # ── Key rebinding ──────────────────────────────────────
@@ -1331,7 +1701,7 @@ class SpeechToType:
         captured = {"key": None, "done": False}
 
         def rebind_callback(proxy, event_type, event, user_info):
-            if event_type in (kCGEventTapDisabledByTimeout, kCGEventTapDisabledByUserInput):
+            if event_type in TAP_DISABLED_EVENTS:
                 return event
             if event_type == kCGEventKeyDown and not captured["done"]:
                 keycode = Quartz.CGEventGetIntegerValueField(
@@ -1356,24 +1726,27 @@ class SpeechToType:
             self._install_hotkey_tap()
             return
 
+        # Serve the tap from this thread's own run loop and block in it until
+        # the callback has run, instead of polling a flag set on the main thread
+        _rl = CoreFoundation.kCFRunLoopDefaultMode
+        rebind_runloop = CFRunLoopGetCurrent()
         rebind_source = CoreFoundation.CFMachPortCreateRunLoopSource(
             None, rebind_tap, 0
         )
-        CoreFoundation.CFRunLoopAddSource(
-            self._main_runloop, rebind_source, CoreFoundation.kCFRunLoopDefaultMode
-        )
+        CoreFoundation.CFRunLoopAddSource(rebind_runloop, rebind_source, _rl)
         CGEventTapEnable(rebind_tap, True)
 
-        # Wait until the main thread's pump fires the callback (timeout 10s)
-        for _ in range(REBIND_TIMEOUT_POLLS):
-            time.sleep(REBIND_POLL_INTERVAL)
-            if captured["done"]:
+        deadline = time.monotonic() + REBIND_TIMEOUT
+        while not captured["done"]:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
                 break
+            # Returns after each handled event (e.g. a key-up) or at the deadline
+            CFRunLoopRunInMode(_rl, remaining, True)
 
         CGEventTapEnable(rebind_tap, False)
-        CoreFoundation.CFRunLoopRemoveSource(
-            self._main_runloop, rebind_source, CoreFoundation.kCFRunLoopDefaultMode
-        )
+        CoreFoundation.CFRunLoopRemoveSource(rebind_runloop, rebind_source, _rl)
+        CoreFoundation.CFMachPortInvalidate(rebind_tap)
 
         if captured["done"] and captured["key"] is not None:
             keycode = captured["key"]
@@ -1381,7 +1754,7 @@ class SpeechToType:
                 setattr(self, attr, None)
                 self.status = "Key disabled"
             else:
-                key_name = KEYCODE_TO_NAME.get(keycode, f"key_{keycode}")
+                key_name = name_for_keycode(keycode)
                 setattr(self, attr, key_name)
                 self.status = f"Key set to {key_name.upper()}"
         else:
@@ -1391,15 +1764,34 @@ class SpeechToType:
         self._needs_redraw = True
         self._install_hotkey_tap()
 
+    def _queue_load(self):
+        self._queued_repo = self._selected_repo()
+        self._tasks.put(self._load_and_hook)
+
     def _load_and_hook(self):
         self.load_model()
         self._install_hotkey_tap()
 
+    def _worker_loop(self, tasks):
+        """Run callables from *tasks* in order until the None sentinel."""
+        while True:
+            task = tasks.get()
+            if task is None:
+                return
+            try:
+                task()
+            except Exception as e:
+                _dlog(f"[{threading.current_thread().name}] task failed: {e}")
+                self.status = f"Error: {e}"
+                self._needs_redraw = True
+
     def quit_app(self):
         self.status = "Quitting..."
         self._needs_redraw = True
         self._save_settings()
         self._running = False
+        self._tasks.put(None)
+        self._commands.put(None)
         self._close_stream()
         self._uninstall_hotkey_tap()
         NSStatusBar.systemStatusBar().removeStatusItem_(self._status_item)
@@ -1423,13 +1815,14 @@ class AppDelegate(NSObject):
         self._refresh_controls()
         self._update_description(0)
 
-        # Periodic timer for UI refresh
-        self._timer = NSTimer.scheduledTimerWithTimeInterval_target_selector_userInfo_repeats_(
-            GUI_TIMER_INTERVAL, self, b"tick:", None, True
-        )
+        # UI refresh timer; runs only while there is something to update
+        self._timer = None
+        self._next_tap_retry = 0.0
+        self.stt._wake_ui = self._wake_timer
+        self.startTimer_(None)
 
         # Load model and install hotkey tap in background
-        threading.Thread(target=self.stt._load_and_hook, daemon=True).start()
+        self.stt._queue_load()
 
     def _build_window(self):
         W, H = 480, 580
@@ -1492,15 +1885,22 @@ class AppDelegate(NSObject):
         self._device_popup = make_popup(dev_names, y, b"deviceChanged:")
         y += ROW_H
 
-        # Row 2: Model + Reload
+        # Row 2: Model + Precision + Reload
         make_label("Model", y)
         self._model_popup = NSPopUpButton.alloc().initWithFrame_pullsDown_(
-            NSMakeRect(CTRL_X, y, CTRL_W - 80, 26), False
+            NSMakeRect(CTRL_X, y, CTRL_W - 160, 26), False
         )
         self._model_popup.addItemsWithTitles_(MODELS)
         self._model_popup.setTarget_(self)
         self._model_popup.setAction_(b"modelChanged:")
         cv.addSubview_(self._model_popup)
+        self._precision_popup = NSPopUpButton.alloc().initWithFrame_pullsDown_(
+            NSMakeRect(CTRL_X + CTRL_W - 154, y, 74, 26), False
+        )
+        self._precision_popup.addItemsWithTitles_(PRECISIONS)
+        self._precision_popup.setTarget_(self)
+        self._precision_popup.setAction_(b"precisionChanged:")
+        cv.addSubview_(self._precision_popup)
         self._reload_btn = NSButton.alloc().initWithFrame_(
             NSMakeRect(CTRL_X + CTRL_W - 74, y, 74, 26)
         )
@@ -1559,6 +1959,8 @@ class AppDelegate(NSObject):
         self._status_label.setFrame_(NSMakeRect(LABEL_X, y, W - 24, 20))
         self._status_label.setFont_(NSFont.boldSystemFontOfSize_(13))
         cv.addSubview_(self._status_label)
+        # What _update_status_display last pushed to the status label and text view
+        self._shown_status = self._shown_color = self._shown_last = None
         y += 26
 
         # Scrollable text view for last transcription
@@ -1579,6 +1981,7 @@ class AppDelegate(NSObject):
         if stt.input_devices:
             self._device_popup.selectItemAtIndex_(stt.device_idx)
         self._model_popup.selectItemAtIndex_(stt.model_idx)
+        self._precision_popup.selectItemAtIndex_(PRECISIONS.index(stt.precision))
         self._hotkey_btn.setTitle_(stt.hotkey.upper() if stt.hotkey else "Disabled")
         self._cancel_btn.setTitle_(stt.cancel_key.upper() if stt.cancel_key else "Disabled")
         self._noenter_btn.setTitle_(stt.no_enter_key.upper() if stt.no_enter_key else "Disabled")
@@ -1599,23 +2002,50 @@ class AppDelegate(NSObject):
             elapsed = time.perf_counter() - stt._record_start_time
             display_status = f"Recording... {elapsed:.1f}s / {MAX_RECORDING_DURATION:.0f}s"
 
+        # Runs every tick while recording; only touch the widgets whose content changed
         model_label = MODELS[stt.loaded_model_idx] if stt.loaded_model_idx is not None else "none"
-        self._status_label.setStringValue_(f"{display_status}  [model: {model_label}]")
+        status_text = f"{display_status}  [model: {model_label}]"
+        if status_text != self._shown_status:
+            self._shown_status = status_text
+            self._status_label.setStringValue_(status_text)
 
         if "Recording" in display_status:
-            self._status_label.setTextColor_(NSColor.systemRedColor())
+            color = "systemRedColor"
         elif "Transcribing" in display_status:
-            self._status_label.setTextColor_(NSColor.systemOrangeColor())
+            color = "systemOrangeColor"
         elif "Ready" in display_status:
-            self._status_label.setTextColor_(NSColor.systemGreenColor())
+            color = "systemGreenColor"
         else:
-            self._status_label.setTextColor_(NSColor.labelColor())
+            color = "labelColor"
+        if color != self._shown_color:
+            self._shown_color = color
+            self._status_label.setTextColor_(getattr(NSColor, color)())
 
         if stt.last_text:
-            self._text_view.setString_(f'"{stt.last_text}" ({stt.last_time:.1f}s)')
+            last = f'"{stt.last_text}" ({stt.last_time:.1f}s)'
+            if last != self._shown_last:
+                self._shown_last = last
+                self._text_view.setString_(last)
 
     # ── Timer tick ──────────────────────────────────────────
 
+    def _wake_timer(self):
+        """Restart the idle UI timer; called from any thread via stt._needs_redraw."""
+        if self._timer is None:
+            self.performSelectorOnMainThread_withObject_waitUntilDone_(
+                b"startTimer:", None, False
+            )
+
+    @objc.typedSelector(b"v@:@")
+    def startTimer_(self, _):
+        if self._timer is not None:
+            return
+        self._last_tick_time = time.perf_counter()  # an idle gap is not a stall
+        self._timer = NSTimer.scheduledTimerWithTimeInterval_target_selector_userInfo_repeats_(
+            GUI_TIMER_INTERVAL, self, b"tick:", None, True
+        )
+        self._timer.setTolerance_(GUI_TIMER_TOLERANCE)
+
     @objc.typedSelector(b"v@:@")
     def tick_(self, timer):
         now = time.perf_counter()
@@ -1631,8 +2061,10 @@ class AppDelegate(NSObject):
         stt = self.stt
         stt._tick_menu_bar()
 
-        # Retry accessibility tap if needed (only if accessibility is now granted)
-        if stt._tap_port is None and self._rebinding is None:
+        # Retry accessibility tap if needed (only if accessibility is now granted).
+        # Granting permission is a manual step, so once a second is plenty.
+        if stt._tap_port is None and self._rebinding is None and now >= self._next_tap_retry:
+            self._next_tap_retry = now + TAP_RETRY_INTERVAL
             if _is_accessibility_trusted(prompt=False):
                 stt._install_hotkey_tap()
 
@@ -1642,6 +2074,14 @@ class AppDelegate(NSObject):
             if not stt._recording:
                 self._refresh_controls()
 
+        # Idle: nothing to count down or retry, so stop waking the main thread
+        # until the next redraw request restarts the timer
+        if not stt._recording and stt._tap_port is not None:
+            self._timer.invalidate()
+            self._timer = None
+            if stt._needs_redraw:  # requested after the check above; _wake_timer saw a timer
+                self.startTimer_(None)
+
     # ── Control actions ─────────────────────────────────────
 
     @objc.typedSelector(b"v@:@")
@@ -1660,10 +2100,27 @@ class AppDelegate(NSObject):
         self._update_description(2)
 
     @objc.typedSelector(b"v@:@")
-    def reloadModel_(self, sender):
-        self.stt._uninstall_hotkey_tap()
+    def precisionChanged_(self, sender):
+        self.stt.precision = PRECISIONS[sender.indexOfSelectedItem()]
         self.stt._save_settings()
-        threading.Thread(target=self.stt._load_and_hook, daemon=True).start()
+        self._update_description(2)
+
+    @objc.typedSelector(b"v@:@")
+    def reloadModel_(self, sender):
+        stt = self.stt
+        stt._save_settings()
+        # Compare with the last queued load, not the finished one: a load still
+        # in the queue would otherwise replace what this press asked for
+        if stt._queued_repo == stt._selected_repo():
+            if stt.model != stt._queued_repo:
+                return  # already on its way
+            if stt._tap_port is not None:
+                # Same weights already loaded and the tap is up; a reload would only cost time
+                stt.status = f"Ready ({MODELS[stt.model_idx]} already loaded)"
+                stt._needs_redraw = True
+                return
+        stt._uninstall_hotkey_tap()
+        stt._queue_load()
 
     @objc.typedSelector(b"v@:@")
     def modeChanged_(self, sender):
@@ -1731,7 +2188,9 @@ class AppDelegate(NSObject):
     # ── Window delegate ─────────────────────────────────────
 
     def windowWillClose_(self, notification):
-        self._timer.invalidate()
+        if self._timer is not None:
+            self._timer.invalidate()
+            self._timer = None
         self.stt.quit_app()
         NSApplication.sharedApplication().terminate_(None)
 
@@ -1751,6 +2210,11 @@ def parse_args():
         choices=MODELS,
         help="whisper model to use (overrides settings file)",
     )
+    parser.add_argument(
+        "--precision",
+        choices=PRECISIONS,
+        help="model weights: fp16 or 4-bit quantized q4 (overrides settings file)",
+    )
     parser.add_argument(
         "--hotkey", "-k",
         help="hotkey for recording (e.g. f2, f5) (overrides settings file)",
@@ -1772,6 +2236,8 @@ if __name__ == "__main__":
     app = SpeechToType(settings_path=args.settings)
     if args.model:
         app.model_idx = MODELS.index(args.model)
+    if args.precision:
+        app.precision = args.precision
     if args.hotkey:
         app.hotkey = args.hotkey
     if args.mode:
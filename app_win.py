@@ -7,18 +7,16 @@ Hold (or toggle) a key to record speech, transcribes and types it out.
 import sys
 import os
 import argparse
-import json5
+import functools
+import json
 import time
 import threading
+import queue
 import ctypes
 import curses
 import numpy as np
 import sounddevice as sd
 import keyboard
-import torch
-import whisper
-import pystray
-from PIL import Image, ImageDraw
 
 user32 = ctypes.windll.user32
 
@@ -26,6 +24,9 @@ WM_CHAR = 0x0102
 WM_KEYDOWN = 0x0100
 WM_KEYUP = 0x0101
 VK_RETURN = 0x0D
+INPUT_KEYBOARD = 1
+KEYEVENTF_KEYUP = 0x0002
+KEYEVENTF_UNICODE = 0x0004
 
 
 class GUITHREADINFO(ctypes.Structure):
@@ -42,9 +43,63 @@ class GUITHREADINFO(ctypes.Structure):
     ]
 
 
+class MOUSEINPUT(ctypes.Structure):
+    _fields_ = [
+        ("dx", ctypes.c_long),
+        ("dy", ctypes.c_long),
+        ("mouseData", ctypes.c_ulong),
+        ("dwFlags", ctypes.c_ulong),
+        ("time", ctypes.c_ulong),
+        ("dwExtraInfo", ctypes.c_size_t),
+    ]
+
+
+class KEYBDINPUT(ctypes.Structure):
+    _fields_ = [
+        ("wVk", ctypes.c_ushort),
+        ("wScan", ctypes.c_ushort),
+        ("dwFlags", ctypes.c_ulong),
+        ("time", ctypes.c_ulong),
+        ("dwExtraInfo", ctypes.c_size_t),
+    ]
+
+
+class _INPUTUNION(ctypes.Union):
+    # MOUSEINPUT is the largest member; it must be present so sizeof(INPUT) matches Win32
+    _fields_ = [("mi", MOUSEINPUT), ("ki", KEYBDINPUT)]
+
+
+class INPUT(ctypes.Structure):
+    _fields_ = [("type", ctypes.c_ulong), ("u", _INPUTUNION)]
+
+
 VERSION = "1.0.0"
 MODELS = ["tiny", "base", "small", "medium", "large"]
+MODEL_INDEX = {name: i for i, name in enumerate(MODELS)}
+DEAFEN_OPTIONS = ("off", "half", "on")
+DEAFEN_INDEX = {name: i for i, name in enumerate(DEAFEN_OPTIONS)}
+DEAFEN_LABELS = {"off": "Off", "half": "50%", "on": "On"}
 SAMPLE_RATE = 16000
+AUDIO_BUFFER_SECONDS = 32  # 30s max clip plus slack for the auto-stop thread
+SILENCE_RMS_THRESHOLD = 0.003  # below this the clip is treated as room noise
+SETTINGS_SAVE_DEBOUNCE = 0.25  # seconds of quiet before a changed setting is written
+UI_TICK_MS = 100  # getch blocks at most this long so background status changes show up
+CUDA_DLLS = ("cublas64_12.dll", "cudnn64_9.dll")  # runtime libraries CTranslate2 links at load
+REBIND_TIMEOUT = 10.0  # seconds to wait for the new key
+
+# Two-valued settings flipped with Left/Right
+TOGGLE_OPTIONS = {
+    "mode": ("push", "toggle"),
+    "after_action": ("enter", "nothing"),
+    "window_target": ("original", "active"),
+}
+
+# TUI rebinding tag -> (settings attribute, prompt)
+REBIND_TARGETS = {
+    "hotkey": ("hotkey", "Press the new record key..."),
+    "cancel": ("cancel_key", "Press the new cancel key..."),
+    "no_enter": ("no_enter_key", "Press the new cancel+type key..."),
+}
 
 
 def _get_app_dir():
@@ -57,6 +112,93 @@ def _get_app_dir():
 DEFAULT_SETTINGS_PATH = os.path.join(_get_app_dir(), "settings.json5")
 
 
+def get_focused_hwnd():
+    """Return the focused control of the foreground window (or the window itself)."""
+    hwnd = user32.GetForegroundWindow()
+    thread_id = user32.GetWindowThreadProcessId(hwnd, None)
+    gui_info = GUITHREADINFO()
+    gui_info.cbSize = ctypes.sizeof(GUITHREADINFO)
+    if user32.GetGUIThreadInfo(thread_id, ctypes.byref(gui_info)) and gui_info.hwndFocus:
+        return gui_info.hwndFocus
+    return hwnd
+
+
+def send_input(events):
+    """Send (vk, scan, flags) keyboard events in one SendInput call.
+
+    Returns the number of events the OS accepted (0 when blocked by UIPI).
+    """
+    inputs = (INPUT * len(events))()
+    for inp, (vk, scan, flags) in zip(inputs, events):
+        inp.type = INPUT_KEYBOARD
+        inp.u.ki.wVk = vk
+        inp.u.ki.wScan = scan
+        inp.u.ki.dwFlags = flags
+    return user32.SendInput(len(events), inputs, ctypes.sizeof(INPUT))
+
+
+def send_unicode_text(text):
+    """Type *text* into the foreground window with a single SendInput batch.
+
+    Returns False if the OS rejected the whole batch.
+    """
+    data = text.encode("utf-16-le")
+    events = []
+    # One key down/up pair per UTF-16 code unit (surrogate pairs go as two units)
+    for i in range(0, len(data), 2):
+        unit = data[i] | (data[i + 1] << 8)
+        events.append((0, unit, KEYEVENTF_UNICODE))
+        events.append((0, unit, KEYEVENTF_UNICODE | KEYEVENTF_KEYUP))
+    return send_input(events) > 0
+
+
+@functools.lru_cache(maxsize=64)
+def wrap_text(text, avail):
+    """Word-wrap text to fit in avail columns. Returns a tuple of lines.
+
+    Cached on (text, avail): the TUI re-wraps the same description and
+    status strings on every redraw.
+    """
+    if avail <= 0:
+        return ()
+    result = []
+    for paragraph in text.split('\n'):
+        cur = ''
+        cur_len = 0  # tracked alongside cur to avoid re-measuring it per word
+        for word in paragraph.split(' '):
+            word_len = len(word)
+            if not cur_len:
+                cur, cur_len = word, word_len
+            elif cur_len + 1 + word_len <= avail:
+                cur += ' ' + word
+                cur_len += 1 + word_len
+            else:
+                result.append(cur)
+                cur, cur_len = word, word_len
+            # Force-break words longer than avail
+            while cur_len > avail:
+                result.append(cur[:avail])
+                cur = cur[avail:]
+                cur_len -= avail
+        if cur or not paragraph:
+            result.append(cur)
+    return tuple(result) if result else ('',)
+
+
+def cuda_libs_available():
+    """True if the CUDA 12 cuBLAS and cuDNN 9 DLLs CTranslate2 needs can be loaded.
+
+    They are not bundled with ctranslate2, and a missing one can abort the
+    process on the first GPU call instead of raising.
+    """
+    for dll in CUDA_DLLS:
+        try:
+            ctypes.WinDLL(dll)
+        except OSError:
+            return False
+    return True
+
+
 def get_input_devices():
     """Return list of (index, name) for input devices."""
     devices = sd.query_devices()
@@ -70,28 +212,43 @@ def get_input_devices():
 class SpeechToType:
     def __init__(self, settings_path=DEFAULT_SETTINGS_PATH):
         self.model = None
+        self.model_device = None
         self.loaded_model_idx = None
         self.icon = None
+        # Tray icons are static per state; render them once up front
+        self._icons = {c: self.create_icon_image(c) for c in ("green", "red")}
         self._key_held = False
         self._recording = False
-        self._chunks = []
+        self._audio_buf = np.empty(SAMPLE_RATE * AUDIO_BUFFER_SECONDS, dtype=np.float32)
+        self._audio_len = 0
         self._stream = None
+        self._stream_device = None  # device index the persistent stream was opened on
         self._target_hwnd = None
+        self._hook_lock = threading.Lock()
+        self._hooked_keys = []  # keys actually hooked, so unhooking survives a rebind
+        self._load_pending = False  # a model load is queued or running
+        self._rebind_pending = None  # TUI rebinding tag while waiting for the new key
+        self._rebind_deadline = 0.0  # monotonic time the pending rebind gives up
+        self._rebind_hook = None  # capture hook handle until the worker removes it
 
         # Configurable settings
-        self.input_devices = get_input_devices()
+        self.input_devices = []
         self.device_idx = 0
         self.hotkey = "f2"
         self.mode = "push"
         self.after_action = "enter"
         self.window_target = "original"
-        self.model_idx = MODELS.index("small")
+        self.model_idx = MODEL_INDEX["small"]
         self.cancel_key = "f3"
         self.no_enter_key = "f4"
         self.deafen_while_recording = "off"  # "off", "half", "on"
         self.settings_path = settings_path
+        self._settings_lock = threading.Lock()
+        self._settings_save_at = None  # monotonic deadline of a pending debounced write
+        self._saved_settings = None  # dict last read from / written to disk
         self._was_muted = False
         self._prev_volume = None
+        self._com_thread = threading.local()
         self._skip_enter = False
         self._cancel_type_used = False
         self._record_start_time = None
@@ -103,6 +260,35 @@ class SpeechToType:
         self._needs_redraw = True
         self._running = True
 
+        # Model loads and rebind bookkeeping run one at a time on a single worker
+        # thread. A rebind waits in a keyboard hook, not on the worker, so the
+        # key is captured even while a load is running.
+        self._tasks = queue.Queue()
+        self._worker = threading.Thread(target=self._worker_loop, daemon=True)
+        self._worker.start()
+
+        # TUI row -> handler; Left/Right handlers take a -1/+1 step
+        self._left_right_handlers = [
+            None,                                              # 0 about
+            self._cycle_device,                                # 1
+            self._cycle_model,                                 # 2
+            None, None, None,                                  # 3-5 keys (rebound with Enter)
+            functools.partial(self._toggle, "mode"),           # 6
+            functools.partial(self._toggle, "after_action"),   # 7
+            functools.partial(self._toggle, "window_target"),  # 8
+            self._cycle_deafen,                                # 9
+        ]
+        self._enter_handlers = [
+            None, None,
+            self._reload_model,
+            functools.partial(self._start_rebind, "hotkey"),
+            functools.partial(self._start_rebind, "cancel"),
+            functools.partial(self._start_rebind, "no_enter"),
+            None, None, None, None,
+        ]
+
+        self.input_devices = get_input_devices()
+
         # Set default device to the system default input
         try:
             default_idx = sd.default.device[0]
@@ -113,18 +299,33 @@ class SpeechToType:
         except Exception:
             pass
 
-        # Load saved settings (overrides defaults)
-        self._load_settings()
+        # Apply saved settings (overrides defaults)
+        data = self._read_settings()
+        if data is not None:
+            self._load_settings(data)
+            self._saved_settings = self._settings_dict()
 
     # ── Settings persistence ────────────────────────────────
 
-    def _load_settings(self):
+    def _read_settings(self):
+        """Parse the settings file; returns None if it is missing or invalid."""
         path = self.settings_path
         if not os.path.exists(path):
-            return
+            return None
         try:
             with open(path, "r") as f:
-                data = json5.load(f)
+                content = f.read()
+            try:
+                return json.loads(content)
+            except json.JSONDecodeError:
+                # Hand-edited file with comments or trailing commas
+                import json5
+                return json5.loads(content)
+        except Exception:
+            return None
+
+    def _load_settings(self, data):
+        try:
             if "hotkey" in data:
                 self.hotkey = data["hotkey"] or None
             if "mode" in data:
@@ -133,8 +334,8 @@ class SpeechToType:
                 self.after_action = data["after_action"]
             if "window_target" in data:
                 self.window_target = data["window_target"]
-            if "model" in data and data["model"] in MODELS:
-                self.model_idx = MODELS.index(data["model"])
+            if "model" in data and data["model"] in MODEL_INDEX:
+                self.model_idx = MODEL_INDEX[data["model"]]
             if "device_name" in data:
                 for i, (idx, name) in enumerate(self.input_devices):
                     if name == data["device_name"]:
@@ -146,7 +347,7 @@ class SpeechToType:
                 self.no_enter_key = data["no_enter_key"] or None
             if "deafen_while_recording" in data:
                 val = data["deafen_while_recording"]
-                if val in ("off", "half", "on"):
+                if val in DEAFEN_INDEX:
                     self.deafen_while_recording = val
                 elif val is True:
                     self.deafen_while_recording = "on"
@@ -155,57 +356,75 @@ class SpeechToType:
         except Exception:
             pass
 
-    def _save_settings(self):
-        dev_name = self.input_devices[self.device_idx][1] if self.input_devices else ""
-        content = f"""\
-{{
-  // Global hotkey to start/stop recording
-  // Examples: "f2", "f5", "scroll lock", "pause"
-  "hotkey": {json5.dumps(self.hotkey)},
+    def _mark_settings_dirty(self):
+        """Schedule a settings write once changes stop for SETTINGS_SAVE_DEBOUNCE.
 
-  // Recording mode: "push" (hold to record) or "toggle" (press to start/stop)
-  "mode": {json5.dumps(self.mode)},
+        The TUI loop flushes it (see _flush_settings_if_due); no timer thread.
+        """
+        self._settings_save_at = time.monotonic() + SETTINGS_SAVE_DEBOUNCE
 
-  // What happens after transcription is typed
-  // "enter" = press Enter key (send message), "nothing" = just type the text
-  "after_action": {json5.dumps(self.after_action)},
-
-  // Where to type the transcription
-  // "original" = window focused when recording started, "active" = currently focused window
-  "window_target": {json5.dumps(self.window_target)},
+    def _flush_settings_if_due(self):
+        save_at = self._settings_save_at
+        if save_at is not None and time.monotonic() >= save_at:
+            self._save_settings()
 
-  // Whisper model size: "tiny", "base", "small", "medium", "large"
-  // Larger models are more accurate but slower and use more RAM
-  "model": {json5.dumps(MODELS[self.model_idx])},
+    def _settings_dict(self):
+        """Current settings as the dict written to disk.
 
-  // Audio input device name (must match a device on your system)
-  "device_name": {json5.dumps(dev_name)},
+        The attributes stay the in-memory source of truth; _saved_settings
+        holds the last dict on disk so unchanged saves are skipped.
+        """
+        dev_name = self.input_devices[self.device_idx][1] if self.input_devices else ""
+        return {
+            "hotkey": self.hotkey,
+            "mode": self.mode,
+            "after_action": self.after_action,
+            "window_target": self.window_target,
+            "model": MODELS[self.model_idx],
+            "device_name": dev_name,
+            "cancel_key": self.cancel_key,
+            "no_enter_key": self.no_enter_key,
+            "deafen_while_recording": self.deafen_while_recording,
+        }
 
-  // Cancel key: cancels the current recording
-  "cancel_key": {json5.dumps(self.cancel_key)},
+    def _save_settings(self):
+        with self._settings_lock:
+            # A synchronous save supersedes any pending debounced one
+            self._settings_save_at = None
+            data = self._settings_dict()
+            if data == self._saved_settings:
+                return  # e.g. cycled an option and back before the flush
+            # Plain JSON so the next start can use the stdlib parser (see README for keys).
+            # Write to a temp file and swap it in so a crash never leaves a truncated file.
+            tmp_path = self.settings_path + ".tmp"
+            try:
+                with open(tmp_path, "w") as f:
+                    json.dump(data, f, indent=2)
+                    f.write("\n")
+                os.replace(tmp_path, self.settings_path)
+                self._saved_settings = data
+            except Exception:
+                pass
 
-  // Cancel but type key: stops recording and types without pressing Enter
-  "no_enter_key": {json5.dumps(self.no_enter_key)},
+    # ── Audio deafen control ───────────────────────────────
 
-  // Deafen (mute) system audio while recording to avoid picking up playback
-  "deafen_while_recording": {json5.dumps(self.deafen_while_recording)},
-}}
-"""
-        try:
-            with open(self.settings_path, "w") as f:
-                f.write(content)
-        except Exception:
-            pass
+    def _get_endpoint_volume(self):
+        """Return the current default speaker's endpoint volume.
 
-    # ── Audio deafen control ───────────────────────────────
+        Resolved on every call: a handle to a previous default device stays
+        valid after headphones are plugged in, and COM handles belong to the
+        thread's apartment. Only COM setup is done once per thread.
+        """
+        import comtypes
+        from pycaw.pycaw import AudioUtilities
+        if not getattr(self._com_thread, "initialized", False):
+            comtypes.CoInitialize()
+            self._com_thread.initialized = True
+        return AudioUtilities.GetSpeakers().EndpointVolume
 
     def _mute_system(self):
         try:
-            import comtypes
-            comtypes.CoInitialize()
-            from pycaw.pycaw import AudioUtilities
-            device = AudioUtilities.GetSpeakers()
-            vol = device.EndpointVolume
+            vol = self._get_endpoint_volume()
             if self.deafen_while_recording == "on":
                 self._was_muted = bool(vol.GetMute())
                 if not self._was_muted:
@@ -219,11 +438,7 @@ class SpeechToType:
 
     def _unmute_system(self):
         try:
-            import comtypes
-            comtypes.CoInitialize()
-            from pycaw.pycaw import AudioUtilities
-            device = AudioUtilities.GetSpeakers()
-            vol = device.EndpointVolume
+            vol = self._get_endpoint_volume()
             if self.deafen_while_recording == "on":
                 if not self._was_muted:
                     vol.SetMute(False, None)
@@ -272,46 +487,96 @@ class SpeechToType:
             # Free previous model from VRAM before loading new one
             if self.model is not None:
                 del self.model
-                if torch.cuda.is_available():
-                    torch.cuda.empty_cache()
                 self.model = None
-            device = "cuda" if torch.cuda.is_available() else "cpu"
-            self.model = whisper.load_model(model_name, device=device)
+            from faster_whisper import WhisperModel
+            device, compute_type = self._pick_compute_type()
+            try:
+                self._load_on(WhisperModel, model_name, device, compute_type)
+            except Exception:
+                if device == "cpu":
+                    raise
+                # A broken CUDA setup (driver, cuBLAS/cuDNN mismatch) shows up here
+                self.model = None
+                device, compute_type = "cpu", "int8"
+                self._load_on(WhisperModel, model_name, device, compute_type)
         finally:
             sys.stderr = real_stderr
 
         elapsed = time.perf_counter() - t0
         self.loaded_model_idx = self.model_idx
-        dev = self.model.device
-        self.status = f"Ready on {dev} (loaded in {elapsed:.1f}s)"
+        self.status = f"Ready on {self.model_device} ({compute_type}, loaded in {elapsed:.1f}s)"
         self._needs_redraw = True
 
+    def _load_on(self, WhisperModel, model_name, device, compute_type):
+        """Load the model on *device* and run one warm-up pass."""
+        self.model = WhisperModel(model_name, device=device, compute_type=compute_type)
+        self.model_device = device
+
+        # Pay CUDA context and kernel selection costs now, not on the first hotkey press
+        self.status = f"Warming up '{model_name}' model..."
+        self._needs_redraw = True
+        segments, _ = self.model.transcribe(
+            np.zeros(SAMPLE_RATE, dtype=np.float32), language="en", beam_size=1
+        )
+        for _ in segments:  # segments is lazy; consume it to run the decoder
+            pass
+
+    @staticmethod
+    def _pick_compute_type():
+        """Return (device, compute_type) for CTranslate2.
+
+        int8 weights with FP16 activations need tensor cores (compute
+        capability 7.0+); older GPUs and the CPU fall back to plain int8.
+        """
+        import ctranslate2
+        if ctranslate2.get_cuda_device_count() > 0 and cuda_libs_available():
+            if "int8_float16" in ctranslate2.get_supported_compute_types("cuda"):
+                return "cuda", "int8_float16"
+            return "cuda", "int8"
+        return "cpu", "int8"
+
     def _ready_status(self):
         if self.model:
-            return f"Ready on {self.model.device}"
+            return f"Ready on {self.model_device}"
         return "Ready"
 
     def _audio_callback(self, indata, frames, time_info, status):
-        self._chunks.append(indata.copy())
+        if not self._recording:
+            return  # stream stays open between recordings
+        # Single producer: only this callback advances _audio_len while recording.
+        # Never allocate on the audio thread; anything past the slack is dropped.
+        start = self._audio_len
+        n = min(frames, self._audio_buf.size - start)
+        np.copyto(self._audio_buf[start:start + n], indata[:n, 0])
+        self._audio_len = start + n
         # Auto-stop at 30s (Whisper's max input length)
         if self._record_start_time and (time.perf_counter() - self._record_start_time) >= 30.0:
             threading.Thread(target=self._stop_recording, daemon=True).start()
 
     def _hook_hotkey(self):
-        if self.hotkey:
-            keyboard.hook_key(self.hotkey, self._on_hotkey_event, suppress=True)
-        if self.cancel_key:
-            keyboard.hook_key(self.cancel_key, self._on_cancel_event, suppress=True)
-        if self.no_enter_key:
-            keyboard.hook_key(self.no_enter_key, self._on_no_enter_event, suppress=True)
+        with self._hook_lock:
+            self._unhook_keys()  # never stack a second hook on a key
+            if self._rebind_pending:
+                return  # the rebind hooks the keys itself once it finishes
+            for key, handler in ((self.hotkey, self._on_hotkey_event),
+                                 (self.cancel_key, self._on_cancel_event),
+                                 (self.no_enter_key, self._on_no_enter_event)):
+                if key:
+                    keyboard.hook_key(key, handler, suppress=True)
+                    self._hooked_keys.append(key)
 
     def _unhook_hotkey(self):
-        for key in [self.hotkey, self.cancel_key, self.no_enter_key]:
-            if key:
-                try:
-                    keyboard.unhook_key(key)
-                except (ValueError, KeyError):
-                    pass
+        with self._hook_lock:
+            self._unhook_keys()
+
+    def _unhook_keys(self):
+        """Unhook whatever _hook_hotkey hooked. Caller holds _hook_lock."""
+        for key in self._hooked_keys:
+            try:
+                keyboard.unhook_key(key)
+            except (ValueError, KeyError):
+                pass
+        self._hooked_keys = []
 
     def _on_hotkey_event(self, e):
         if self.mode == "push":
@@ -339,15 +604,11 @@ class SpeechToType:
         if e.event_type == "down" and self._recording:
             self._recording = False
             self._record_start_time = None
-            if self._stream:
-                self._stream.stop()
-                self._stream.close()
-                self._stream = None
-            self._chunks = []
+            self._audio_len = 0
             if self.deafen_while_recording:
                 self._unmute_system()
             if self.icon:
-                self.icon.icon = self.create_icon_image("green")
+                self.icon.icon = self._icons["green"]
             self._key_held = False
             self.status = "Cancelled"
             self._needs_redraw = True
@@ -360,23 +621,22 @@ class SpeechToType:
             self._key_held = False
             self._stop_recording()
 
-    def _start_recording(self):
-        if self._recording:
-            return
-        self._recording = True
-        self._skip_enter = False
-        self._chunks = []
-
-        hwnd = user32.GetForegroundWindow()
-        thread_id = user32.GetWindowThreadProcessId(hwnd, None)
-        gui_info = GUITHREADINFO()
-        gui_info.cbSize = ctypes.sizeof(GUITHREADINFO)
-        if user32.GetGUIThreadInfo(thread_id, ctypes.byref(gui_info)) and gui_info.hwndFocus:
-            self._target_hwnd = gui_info.hwndFocus
-        else:
-            self._target_hwnd = hwnd
-
-        dev_index = self.input_devices[self.device_idx][0] if self.input_devices else None
+    def _selected_device(self):
+        """PortAudio index of the selected input device (None = system default)."""
+        return self.input_devices[self.device_idx][0] if self.input_devices else None
+
+    def _ensure_stream(self):
+        """Open the input stream once and keep it running across recordings.
+
+        Opening a WASAPI stream can take 50-200 ms, so it is only reopened
+        when the selected device changes or the stream has died (e.g. the
+        mic was unplugged); the callback ignores audio while not recording.
+        """
+        dev_index = self._selected_device()
+        if self._stream is not None:
+            if self._stream_device == dev_index and self._stream.active:
+                return
+            self._close_stream()
         self._stream = sd.InputStream(
             samplerate=SAMPLE_RATE,
             channels=1,
@@ -385,36 +645,64 @@ class SpeechToType:
             callback=self._audio_callback,
         )
         self._stream.start()
+        self._stream_device = dev_index
+
+    def _close_stream(self):
+        """Close the persistent stream (device change or app exit only)."""
+        if self._stream is not None:
+            try:
+                self._stream.stop()
+                self._stream.close()
+            except Exception:
+                pass
+            self._stream = None
+            self._stream_device = None
+
+    def _start_recording(self):
+        if self._recording:
+            return
+        self._skip_enter = False
+        self._audio_len = 0
+
+        self._target_hwnd = get_focused_hwnd()
+
+        try:
+            self._ensure_stream()
+        except Exception as e:
+            self.status = f"Recording failed: {e}"
+            self._needs_redraw = True
+            return
         self._record_start_time = time.perf_counter()
+        self._recording = True
         if self.deafen_while_recording != "off":
             self._mute_system()
         self.status = "Recording... 0.0s / 30s"
         self._needs_redraw = True
         if self.icon:
-            self.icon.icon = self.create_icon_image("red")
+            self.icon.icon = self._icons["red"]
 
     def _stop_recording(self):
         if not self._recording:
             return
         self._recording = False
         self._record_start_time = None
-        if self._stream:
-            self._stream.stop()
-            self._stream.close()
-            self._stream = None
 
         if self.icon:
-            self.icon.icon = self.create_icon_image("green")
+            self.icon.icon = self._icons["green"]
 
         if self.deafen_while_recording != "off":
             self._unmute_system()
 
-        if not self._chunks:
+        if self._stream is not None and self._stream_device != self._selected_device():
+            self._close_stream()  # device was changed mid-recording; release the old one
+
+        if not self._audio_len:
             self.status = self._ready_status()
             self._needs_redraw = True
             return
 
-        audio = np.concatenate(self._chunks, axis=0).flatten()
+        # Copy out so the next recording can reuse the buffer during transcription
+        audio = self._audio_buf[:self._audio_len].copy()
         duration = len(audio) / SAMPLE_RATE
 
         if duration < 0.3:
@@ -422,18 +710,25 @@ class SpeechToType:
             self._needs_redraw = True
             return
 
+        rms = float(np.sqrt(np.dot(audio, audio) / len(audio)))
+        if rms < SILENCE_RMS_THRESHOLD:
+            self.status = "Silence, skipped"
+            self._needs_redraw = True
+            return
+
+        if self.model is None:
+            self.status = "No model loaded, press Reload on the model row"
+            self._needs_redraw = True
+            return
+
         self.status = f"Transcribing {duration:.1f}s of audio..."
         self._needs_redraw = True
         threading.Thread(target=self._transcribe_and_type, args=(audio,), daemon=True).start()
 
     def _transcribe_and_type(self, audio):
         t0 = time.perf_counter()
-        audio_padded = whisper.pad_or_trim(audio)
-        mel = whisper.log_mel_spectrogram(audio_padded, n_mels=self.model.dims.n_mels).to(self.model.device)
-        use_fp16 = self.model.device.type == "cuda"
-        options = whisper.DecodingOptions(language="en", fp16=use_fp16)
-        result = whisper.decode(self.model, mel, options)
-        text = result.text.strip()
+        segments, _ = self.model.transcribe(audio, language="en", beam_size=1)
+        text = "".join(seg.text for seg in segments).strip()
         elapsed = time.perf_counter() - t0
 
         if not text:
@@ -450,26 +745,30 @@ class SpeechToType:
             self.status = self._ready_status()
         self._needs_redraw = True
 
-        if self.window_target == "active":
-            hwnd = user32.GetForegroundWindow()
-            thread_id = user32.GetWindowThreadProcessId(hwnd, None)
-            gui_info = GUITHREADINFO()
-            gui_info.cbSize = ctypes.sizeof(GUITHREADINFO)
-            if user32.GetGUIThreadInfo(thread_id, ctypes.byref(gui_info)) and gui_info.hwndFocus:
-                hwnd = gui_info.hwndFocus
-        else:
-            hwnd = self._target_hwnd
+        focused = get_focused_hwnd()
+        hwnd = focused if self.window_target == "active" else self._target_hwnd
+        if not hwnd:
+            return
 
-        if hwnd:
-            for ch in text:
-                user32.PostMessageW(hwnd, WM_CHAR, ord(ch), 0)
-                time.sleep(0.005)
-            if self.after_action == "enter" and not self._skip_enter:
+        press_enter = self.after_action == "enter" and not self._skip_enter
+        # SendInput can only reach the focused window; fall back to per-window
+        # messages when the target lost focus or input is blocked (UIPI).
+        if hwnd == focused and send_unicode_text(text):
+            if press_enter:
                 time.sleep(0.05)
-                user32.PostMessageW(hwnd, WM_KEYDOWN, VK_RETURN, 0x001C0001)
-                user32.PostMessageW(hwnd, WM_KEYUP, VK_RETURN, 0xC01C0001)
+                send_input([(VK_RETURN, 0, 0), (VK_RETURN, 0, KEYEVENTF_KEYUP)])
+            return
+
+        for ch in text:
+            user32.PostMessageW(hwnd, WM_CHAR, ord(ch), 0)
+            time.sleep(0.005)
+        if press_enter:
+            time.sleep(0.05)
+            user32.PostMessageW(hwnd, WM_KEYDOWN, VK_RETURN, 0x001C0001)
+            user32.PostMessageW(hwnd, WM_KEYUP, VK_RETURN, 0xC01C0001)
 
     def create_icon_image(self, color="green"):
+        from PIL import Image, ImageDraw
         img = Image.new("RGBA", (64, 64), (0, 0, 0, 0))
         draw = ImageDraw.Draw(img)
         colors = {"green": "#22c55e", "red": "#ef4444", "gray": "#6b7280"}
@@ -486,17 +785,20 @@ class SpeechToType:
         self._needs_redraw = True
         self._save_settings()
         self._running = False
+        self._tasks.put(None)
+        self._close_stream()
         keyboard.unhook_all()
         if self.icon:
             self.icon.stop()
 
     def run_tray(self):
+        import pystray
         menu = pystray.Menu(
             pystray.MenuItem("Quit", self.quit_app),
         )
         self.icon = pystray.Icon(
             "vibe-code-mic",
-            self.create_icon_image("green"),
+            self._icons["green"],
             "vibe-code-mic",
             menu,
         )
@@ -512,44 +814,47 @@ class SpeechToType:
         "large":  "openai/whisper-large-v3 — 1550M params, ~10GB RAM, ~3GB disk. Best accuracy, requires significant resources.",
     }
 
+    # Rows whose text never changes
+    STATIC_INFO = {
+        0: f"vibe-code-mic v{VERSION}. Local speech recognition powered by OpenAI Whisper. All processing happens on your machine — no data is sent to the cloud.",
+        3: "Global hotkey to start/stop recording. Press Enter to rebind, then press any key to set it as the new hotkey.",
+        4: "A single tap during recording cancels it. Audio is discarded and nothing is typed. In toggle mode, press this before pressing the record key again.",
+        5: "A single tap during recording stops it and types the text without pressing Enter. Useful when you want to edit the text before sending. In toggle mode, press this before pressing the record key again.",
+    }
+
+    # Rows whose text follows a setting: row -> (attribute, fallback value, value -> text)
+    SETTING_INFO = {
+        6: ("mode", "toggle", {
+            "push":   "Push to hold: hold the key to record, release to stop and transcribe. Good for quick voice commands.",
+            "toggle": "Toggle: press once to start recording, press again to stop and transcribe. Good for longer dictation.",
+        }),
+        7: ("after_action", "nothing", {
+            "enter":   "Presses Enter after typing the transcription. Useful for sending messages in chat apps.",
+            "nothing": "Just types the text with no Enter key pressed after. Useful for filling in text fields or documents.",
+        }),
+        8: ("window_target", "active", {
+            "original": "Types into the window that was focused when you started recording, even if you switch apps during transcription.",
+            "active":   "Types into whatever window is active when transcription finishes. The target may change if you switch apps.",
+        }),
+        9: ("deafen_while_recording", "off", {
+            "on":   "System audio will be fully muted while recording and restored when you stop. Prevents your speakers from being picked up by the mic.",
+            "half": "System audio volume will be reduced by 50% while recording and restored when you stop. Reduces speaker bleed without losing all audio.",
+            "off":  "System audio stays on during recording. Enable this if your microphone picks up sounds from your speakers.",
+        }),
+    }
+
     def _get_description(self, selected):
-        if selected == 0:
-            return f"vibe-code-mic v{VERSION}. Local speech recognition powered by OpenAI Whisper. All processing happens on your machine — no data is sent to the cloud."
-        elif selected == 1:
+        if selected in self.STATIC_INFO:
+            return self.STATIC_INFO[selected]
+        if selected in self.SETTING_INFO:
+            attr, fallback, texts = self.SETTING_INFO[selected]
+            return texts.get(getattr(self, attr), texts[fallback])
+        if selected == 1:
             if self.input_devices:
                 return "Input device for recording. Use Left/Right to cycle through available microphones and audio inputs on your system."
             return "No input devices found."
-        elif selected == 2:
-            model_name = MODELS[self.model_idx]
-            return self.MODEL_INFO.get(model_name, "")
-        elif selected == 3:
-            return "Global hotkey to start/stop recording. Press Enter to rebind, then press any key to set it as the new hotkey."
-        elif selected == 4:
-            return "A single tap during recording cancels it. Audio is discarded and nothing is typed. In toggle mode, press this before pressing the record key again."
-        elif selected == 5:
-            return "A single tap during recording stops it and types the text without pressing Enter. Useful when you want to edit the text before sending. In toggle mode, press this before pressing the record key again."
-        elif selected == 6:
-            if self.mode == "push":
-                return "Push to hold: hold the key to record, release to stop and transcribe. Good for quick voice commands."
-            else:
-                return "Toggle: press once to start recording, press again to stop and transcribe. Good for longer dictation."
-        elif selected == 7:
-            if self.after_action == "enter":
-                return "Presses Enter after typing the transcription. Useful for sending messages in chat apps."
-            else:
-                return "Just types the text with no Enter key pressed after. Useful for filling in text fields or documents."
-        elif selected == 8:
-            if self.window_target == "original":
-                return "Types into the window that was focused when you started recording, even if you switch apps during transcription."
-            else:
-                return "Types into whatever window is active when transcription finishes. The target may change if you switch apps."
-        elif selected == 9:
-            if self.deafen_while_recording == "on":
-                return "System audio will be fully muted while recording and restored when you stop. Prevents your speakers from being picked up by the mic."
-            elif self.deafen_while_recording == "half":
-                return "System audio volume will be reduced by 50% while recording and restored when you stop. Reduces speaker bleed without losing all audio."
-            else:
-                return "System audio stays on during recording. Enable this if your microphone picks up sounds from your speakers."
+        if selected == 2:
+            return self.MODEL_INFO.get(MODELS[self.model_idx], "")
         return ""
 
     # ── Curses TUI ──────────────────────────────────────────
@@ -562,30 +867,6 @@ class SpeechToType:
             if y < h and x < w:
                 stdscr.addnstr(y, x, text, w - x - 1, attr)
 
-        def wrap_text(text, avail):
-            """Word-wrap text to fit in avail columns. Returns list of lines."""
-            if avail <= 0:
-                return []
-            result = []
-            for paragraph in text.split('\n'):
-                words = paragraph.split(' ')
-                cur = ''
-                for word in words:
-                    if not cur:
-                        cur = word
-                    elif len(cur) + 1 + len(word) <= avail:
-                        cur += ' ' + word
-                    else:
-                        result.append(cur)
-                        cur = word
-                    # Force-break words longer than avail
-                    while len(cur) > avail:
-                        result.append(cur[:avail])
-                        cur = cur[avail:]
-                if cur or not paragraph:
-                    result.append(cur)
-            return result if result else ['']
-
         def draw_wrapped(y, x, text, attr=0):
             """Draw text wrapping across multiple lines. Returns number of lines used."""
             avail = w - x - 1
@@ -600,7 +881,7 @@ class SpeechToType:
         # About (not configurable, info-only)
         prefix = "> " if selected == 0 else "  "
         safe_addstr(2, 0, f"{prefix}About:         ", curses.A_BOLD if selected == 0 else 0)
-        safe_addstr(2, 17, f" v{VERSION} ", curses.color_pair(4))
+        safe_addstr(2, 17, f" v{VERSION} ", self._info_color)
 
         # Device
         dev_name = self.input_devices[self.device_idx][1] if self.input_devices else "(none)"
@@ -674,14 +955,13 @@ class SpeechToType:
         # Deafen while recording
         prefix = "> " if selected == 9 else "  "
         attr = curses.A_REVERSE if selected == 9 else 0
-        deafen_labels = {"off": "Off", "half": "50%", "on": "On"}
-        deafen_label = deafen_labels.get(self.deafen_while_recording, "Off")
+        deafen_label = DEAFEN_LABELS.get(self.deafen_while_recording, "Off")
         safe_addstr(11, 0, f"{prefix}Deafen on Rec: ", curses.A_BOLD if selected == 9 else 0)
         safe_addstr(11, 17, f" < {deafen_label} > ", attr)
 
         # Description for selected option (wraps across lines)
         desc = self._get_description(selected)
-        desc_lines = draw_wrapped(13, 2, desc, curses.color_pair(4))
+        desc_lines = draw_wrapped(13, 2, desc, self._info_color)
 
         # Bottom-pinned: help line at very bottom, status above it, last text fills middle
         help_y = h - 1
@@ -694,16 +974,10 @@ class SpeechToType:
             elapsed = time.perf_counter() - self._record_start_time
             display_status = f"Recording... {elapsed:.1f}s / 30s"
 
-        if "Recording" in display_status:
-            status_color = curses.color_pair(2) | curses.A_BOLD
-        elif "Transcribing" in display_status:
-            status_color = curses.color_pair(3) | curses.A_BOLD
-        elif "Quitting" in display_status:
-            status_color = curses.color_pair(3) | curses.A_BOLD
-        elif "Ready" in display_status:
-            status_color = curses.color_pair(1)
-        else:
-            status_color = curses.color_pair(4)
+        status_color = next(
+            (attr for word, attr in self._status_colors if word in display_status),
+            self._info_color,
+        )
         model_label = MODELS[self.loaded_model_idx] if self.loaded_model_idx is not None else "none"
         status_text = f"{display_status}  [model: {model_label}]"
         status_avail = w - 10 - 1
@@ -722,138 +996,221 @@ class SpeechToType:
             avail_lines = last_end_y - last_start_y
             avail_width = w - 12
             if avail_lines > 0 and avail_width > 0:
-                safe_addstr(last_start_y, 0, "  Last:   ", curses.color_pair(4))
+                safe_addstr(last_start_y, 0, "  Last:   ", self._info_color)
                 # Word-wrap the transcription text across available lines
                 text_with_time = f'"{self.last_text}" ({self.last_time:.1f}s)'
                 wrapped = wrap_text(text_with_time, avail_width)
                 for line, chunk in enumerate(wrapped[:avail_lines]):
                     safe_addstr(last_start_y + line, 10, chunk, curses.A_BOLD)
 
-        stdscr.refresh()
+        # Stage only; the caller flushes to the terminal with one curses.doupdate()
+        stdscr.noutrefresh()
 
     def run_curses(self, stdscr):
         curses.curs_set(0)
-        stdscr.nodelay(True)
-        stdscr.timeout(100)
+        # Block in getch until a key arrives or the UI tick elapses (no busy polling)
+        stdscr.timeout(UI_TICK_MS)
         curses.start_color()
         curses.use_default_colors()
         curses.init_pair(1, curses.COLOR_GREEN, -1)   # ready
         curses.init_pair(2, curses.COLOR_RED, -1)      # recording
         curses.init_pair(3, curses.COLOR_YELLOW, -1)   # transcribing
         curses.init_pair(4, curses.COLOR_CYAN, -1)     # info
+        # First matching word wins; built once since color_pair() needs init_pair first
+        self._status_colors = (
+            ("Recording", curses.color_pair(2) | curses.A_BOLD),
+            ("Transcribing", curses.color_pair(3) | curses.A_BOLD),
+            ("Quitting", curses.color_pair(3) | curses.A_BOLD),
+            ("Ready", curses.color_pair(1)),
+        )
+        self._info_color = curses.color_pair(4)  # also the fallback status color
 
         NUM_SETTINGS = 10
         selected = 0  # 0=about, 1=device, 2=model, 3=hotkey, 4=cancel_key, 5=no_enter_key, 6=mode, 7=after, 8=target, 9=deafen
-        rebinding = False
-
-        # Load model in background
-        threading.Thread(target=self._load_and_hook, daemon=True).start()
+        draining = False  # True while handling a burst of queued keys (key repeat, paste)
+        timer_tenths = None  # recording timer value last drawn, in 0.1s steps
 
         while self._running:
-            if self._needs_redraw or True:  # always redraw (cheap at 10fps)
-                self.draw_ui(stdscr, selected, rebinding)
-                self._needs_redraw = False
+            self._flush_settings_if_due()
+            self._expire_rebind_if_due()
+
+            # Redraw only on state changes or when the shown recording time changes.
+            # While draining a burst, skip drawing until the input queue is empty.
+            if not draining:
+                redraw = self._needs_redraw
+                start = self._record_start_time
+                if self._recording and start is not None:
+                    tenths = round((time.perf_counter() - start) * 10)
+                    if tenths != timer_tenths:
+                        timer_tenths = tenths
+                        redraw = True
+                if redraw:
+                    self._needs_redraw = False
+                    self.draw_ui(stdscr, selected, self._rebind_pending)
+                    curses.doupdate()
 
             try:
                 key = stdscr.getch()
             except KeyboardInterrupt:
                 self.status = "Quitting..."
-                self.draw_ui(stdscr, selected, rebinding)
-                stdscr.refresh()
+                self.draw_ui(stdscr, selected, self._rebind_pending)
+                curses.doupdate()
                 time.sleep(0.3)
                 break
             except Exception:
                 key = -1
 
             if key == -1:
-                continue
+                if draining:
+                    # Burst finished: draw once and go back to blocking reads
+                    draining = False
+                    stdscr.timeout(UI_TICK_MS)
+                continue  # tick timeout: loop back to redraw only if something changed
+
+            if not draining:
+                # The first key is handled immediately; any keys already queued
+                # behind it are read without waiting and share a single redraw.
+                draining = True
+                stdscr.timeout(0)
 
             # Ctrl+C
             if key == 3:
                 break
 
-            if rebinding:
-                rebinding = False
-                self._needs_redraw = True
-                continue
+            # Any key (navigation, edits, KEY_RESIZE) changes what is on screen
+            self._needs_redraw = True
 
             if key == curses.KEY_UP:
                 selected = (selected - 1) % NUM_SETTINGS
             elif key == curses.KEY_DOWN:
                 selected = (selected + 1) % NUM_SETTINGS
             elif key == curses.KEY_LEFT or key == curses.KEY_RIGHT:
-                if selected == 1 and self.input_devices:
-                    if key == curses.KEY_LEFT:
-                        self.device_idx = (self.device_idx - 1) % len(self.input_devices)
-                    else:
-                        self.device_idx = (self.device_idx + 1) % len(self.input_devices)
-                elif selected == 2:
-                    if key == curses.KEY_LEFT:
-                        self.model_idx = (self.model_idx - 1) % len(MODELS)
-                    else:
-                        self.model_idx = (self.model_idx + 1) % len(MODELS)
-                elif selected == 6:
-                    self.mode = "toggle" if self.mode == "push" else "push"
-                elif selected == 7:
-                    self.after_action = "nothing" if self.after_action == "enter" else "enter"
-                elif selected == 8:
-                    self.window_target = "active" if self.window_target == "original" else "original"
-                elif selected == 9:
-                    deafen_options = ["off", "half", "on"]
-                    cur = deafen_options.index(self.deafen_while_recording) if self.deafen_while_recording in deafen_options else 0
-                    if key == curses.KEY_LEFT:
-                        cur = (cur - 1) % len(deafen_options)
-                    else:
-                        cur = (cur + 1) % len(deafen_options)
-                    self.deafen_while_recording = deafen_options[cur]
-                self._save_settings()
+                handler = self._left_right_handlers[selected]
+                if handler:
+                    handler(-1 if key == curses.KEY_LEFT else 1)
+                    self._mark_settings_dirty()
             elif key == 10 or key == curses.KEY_ENTER:  # Enter
-                if selected == 2:
-                    self._unhook_hotkey()
-                    self._save_settings()
-                    threading.Thread(target=self._load_and_hook, daemon=True).start()
-                elif selected == 3:
-                    rebinding = "hotkey"
-                    self._unhook_hotkey()
-                    self.status = "Press the new record key..."
-                    self._needs_redraw = True
-                    threading.Thread(target=lambda: self._rebind_key("hotkey"), daemon=True).start()
-                elif selected == 4:
-                    rebinding = "cancel"
-                    self._unhook_hotkey()
-                    self.status = "Press the new cancel key..."
-                    self._needs_redraw = True
-                    threading.Thread(target=lambda: self._rebind_key("cancel_key"), daemon=True).start()
-                elif selected == 5:
-                    rebinding = "no_enter"
-                    self._unhook_hotkey()
-                    self.status = "Press the new cancel+type key..."
-                    self._needs_redraw = True
-                    threading.Thread(target=lambda: self._rebind_key("no_enter_key"), daemon=True).start()
-
-    def _rebind_key(self, attr="hotkey"):
-        """Wait for a single keypress and rebind the specified key. Escape to disable."""
-        event = keyboard.read_event(suppress=False)
-        while event.event_type != "down":
-            event = keyboard.read_event(suppress=False)
-        if event.name == "esc":
+                handler = self._enter_handlers[selected]
+                if handler:
+                    handler()
+
+    # ── Settings actions ────────────────────────────────────
+    # Indexed by the TUI row (see _left_right_handlers / _enter_handlers).
+
+    def _cycle_device(self, step):
+        if not self.input_devices:
+            return
+        if not self._recording:  # otherwise _stop_recording closes it
+            self._close_stream()  # reopened on the new device at next recording
+        self.device_idx = (self.device_idx + step) % len(self.input_devices)
+
+    def _cycle_model(self, step):
+        self.model_idx = (self.model_idx + step) % len(MODELS)
+
+    def _toggle(self, attr, step):
+        """Flip a two-valued setting to the other entry of its TOGGLE_OPTIONS pair."""
+        a, b = TOGGLE_OPTIONS[attr]
+        setattr(self, attr, b if getattr(self, attr) == a else a)
+
+    def _cycle_deafen(self, step):
+        cur = DEAFEN_INDEX.get(self.deafen_while_recording, 0)
+        self.deafen_while_recording = DEAFEN_OPTIONS[(cur + step) % len(DEAFEN_OPTIONS)]
+
+    def _reload_model(self):
+        self._save_settings()
+        if self._load_pending:
+            self.status = "Load in progress, press Reload again when done"
+            self._needs_redraw = True
+            return
+        self._unhook_hotkey()
+        self._queue_load()
+
+    def _start_rebind(self, rebinding):
+        """Unhook keys and capture the next key press as the new one.
+
+        The TUI shows the prompt for as long as _rebind_pending is set.
+        """
+        with self._hook_lock:
+            # One rebind at a time, including the worker's cleanup of the last one
+            if self._rebind_pending or self._rebind_hook is not None:
+                return None
+            self._rebind_pending = rebinding
+            self._rebind_deadline = time.monotonic() + REBIND_TIMEOUT
+            self._unhook_keys()
+        self.status = REBIND_TARGETS[rebinding][1]
+        self._needs_redraw = True
+        # Suppressing hook: the captured key is consumed, so it neither reaches
+        # the TUI as a command nor types into another window
+        self._rebind_hook = keyboard.hook(self._on_rebind_event, suppress=True)
+
+    def _on_rebind_event(self, e):
+        """Blocking keyboard hook while rebinding; returns False to swallow the event."""
+        if e.event_type != "down" or not self._rebind_pending:
+            return True
+        self._end_rebind(e.name)
+        return False
+
+    def _expire_rebind_if_due(self):
+        if self._rebind_pending and time.monotonic() >= self._rebind_deadline:
+            self._end_rebind(None)
+
+    def _end_rebind(self, key_name):
+        """Apply the captured key (None = timed out, "esc" = disable). First call wins.
+
+        Runs on the hook thread or the TUI loop, so it only sets attributes;
+        removing the capture hook, re-hooking and saving are queued on the worker.
+        """
+        with self._hook_lock:
+            rebinding = self._rebind_pending
+            if rebinding is None:
+                return
+            self._rebind_pending = None
+        attr = REBIND_TARGETS[rebinding][0]
+        if key_name is None:
+            self.status = "Rebind timed out"
+        elif key_name == "esc":
             setattr(self, attr, None)
-            self._hook_hotkey()
-            self._save_settings()
             self.status = "Key disabled"
         else:
-            new_key = event.name
-            setattr(self, attr, new_key)
-            self._hook_hotkey()
-            self._save_settings()
-            self.status = f"Key set to {new_key.upper()}"
+            setattr(self, attr, key_name)
+            self.status = f"Key set to {key_name.upper()}"
         self._needs_redraw = True
+        self._tasks.put(self._finish_rebind)
+
+    def _finish_rebind(self):
+        keyboard.unhook(self._rebind_hook)
+        self._rebind_hook = None
+        if not self._load_pending:
+            self._hook_hotkey()  # otherwise the pending load hooks the keys when done
+        self._save_settings()
+
+    def _queue_load(self):
+        self._load_pending = True
+        self._tasks.put(self._load_and_hook)
 
     def _load_and_hook(self):
-        self.load_model()
-        self._hook_hotkey()
+        try:
+            self.load_model()
+        finally:
+            self._load_pending = False
+            if not self._rebind_pending:
+                self._hook_hotkey()  # also after a failed load, so the keys keep working
+
+    def _worker_loop(self):
+        """Run queued background tasks in order until the None sentinel."""
+        while True:
+            task = self._tasks.get()
+            if task is None:
+                return
+            try:
+                task()
+            except Exception as e:
+                self.status = f"Error: {e}"
+                self._needs_redraw = True
 
     def run(self):
+        # Start loading the model before the tray and curses come up
+        self._queue_load()
         threading.Thread(target=self.run_tray, daemon=True).start()
         curses.wrapper(self.run_curses)
         print("Quitting...")
@@ -895,14 +1252,15 @@ if __name__ == "__main__":
     args = parse_args()
     app = SpeechToType(settings_path=args.settings)
     if args.model:
-        app.model_idx = MODELS.index(args.model)
+        app.model_idx = MODEL_INDEX[args.model]
     if args.hotkey:
         app.hotkey = args.hotkey
     if args.mode:
         app.mode = args.mode
     if args.device:
+        needle = args.device.casefold()
         for i, (idx, name) in enumerate(app.input_devices):
-            if args.device.lower() in name.lower():
+            if needle in name.casefold():
                 app.device_idx = i
                 break
     app.run()
@@ -4,16 +4,20 @@
 import sys
 import os
 
+from PyInstaller.utils.hooks import collect_all
+
 block_cipher = None
 
+# Collect faster_whisper and ctranslate2 with their data files and native libraries
+fw_datas, fw_binaries, fw_hidden = collect_all('faster_whisper')
+ct2_datas, ct2_binaries, ct2_hidden = collect_all('ctranslate2')
+
 a = Analysis(
     ['app_win.py'],
     pathex=[],
-    binaries=[],
-    datas=[],
-    hiddenimports=[
-        'torch',
-        'whisper',
+    binaries=fw_binaries + ct2_binaries,
+    datas=fw_datas + ct2_datas,
+    hiddenimports=fw_hidden + ct2_hidden + [
         'sounddevice',
         '_sounddevice_data',
         'json5',
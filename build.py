@@ -3,10 +3,14 @@
 
 Usage:
     pip install pyinstaller
-    python build.py
+    python build.py [--clean]
 
 Detects the current platform and runs PyInstaller with the appropriate
 spec file. Outputs to dist/vibe-code-mic/.
+
+Rebuilds reuse PyInstaller's analysis cache in build/, which makes them
+much faster. Pass --clean (e.g. for release builds) to discard the cache
+and build from scratch.
 """
 
 import platform
@@ -27,7 +31,9 @@ def main():
 
     print(f"Building for {system} using {spec_file}...")
 
-    cmd = [sys.executable, "-m", "PyInstaller", "--clean", "--noconfirm", spec_file]
+    cmd = [sys.executable, "-m", "PyInstaller", "--noconfirm", spec_file]
+    if "--clean" in sys.argv[1:]:
+        cmd.insert(3, "--clean")
     result = subprocess.run(cmd)
 
     if result.returncode == 0:
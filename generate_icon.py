@@ -1,41 +1,37 @@
 #!/usr/bin/env python3
 """Generate a macOS .icns app icon with a stylized microphone design."""
 
+import io
 import math
 import os
-import shutil
 import subprocess
 import sys
+import tempfile
 
+import numpy as np
 from PIL import Image, ImageDraw
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 SIZE = 1024
 OUTPUT_PNG = os.path.join(BASE_DIR, "icon_1024.png")
 OUTPUT_ICNS = os.path.join(BASE_DIR, "app_icon.icns")
-ICONSET_DIR = os.path.join(BASE_DIR, "app_icon.iconset")
 
 
-def lerp_color(c1, c2, t):
-    """Linearly interpolate between two RGB colors."""
-    return tuple(int(a + (b - a) * t) for a, b in zip(c1, c2))
-
-
-def draw_rounded_rect(draw, bbox, radius, fill):
-    """Draw a filled rounded rectangle."""
+def rounded_rect_mask(size, bbox, radius):
+    """Return an L-mode mask with a filled rounded rectangle, computed in one NumPy pass."""
     x0, y0, x1, y1 = bbox
-    # Four corners
-    draw.ellipse([x0, y0, x0 + 2 * radius, y0 + 2 * radius], fill=fill)
-    draw.ellipse([x1 - 2 * radius, y0, x1, y0 + 2 * radius], fill=fill)
-    draw.ellipse([x0, y1 - 2 * radius, x0 + 2 * radius, y1], fill=fill)
-    draw.ellipse([x1 - 2 * radius, y1 - 2 * radius, x1, y1], fill=fill)
-    # Connecting rectangles
-    draw.rectangle([x0 + radius, y0, x1 - radius, y1], fill=fill)
-    draw.rectangle([x0, y0 + radius, x1, y1 - radius], fill=fill)
+    cx, cy = (x0 + x1) / 2, (y0 + y1) / 2
+    ys = np.arange(size)[:, None]
+    xs = np.arange(size)[None, :]
+    # Distance past the straight edges; zero inside the inner (corner-less) rectangle
+    dx = np.maximum(0, np.abs(xs - cx) - ((x1 - x0) / 2 - radius))
+    dy = np.maximum(0, np.abs(ys - cy) - ((y1 - y0) / 2 - radius))
+    mask = (dx * dx + dy * dy <= radius * radius).astype(np.uint8) * 255
+    return Image.fromarray(mask)
 
 
 def generate_icon():
-    """Generate the 1024x1024 icon PNG."""
+    """Generate the 1024x1024 icon image."""
     img = Image.new("RGBA", (SIZE, SIZE), (0, 0, 0, 0))
     draw = ImageDraw.Draw(img)
 
@@ -46,20 +42,19 @@ def generate_icon():
     corner_radius = int(SIZE * 0.22)  # macOS-style rounding
     margin = 2
 
-    # Build gradient by drawing horizontal lines clipped to rounded rect shape
+    # Build gradient clipped to rounded rect shape
     # First, create a mask for the rounded rect
-    mask = Image.new("L", (SIZE, SIZE), 0)
-    mask_draw = ImageDraw.Draw(mask)
-    draw_rounded_rect(mask_draw, [margin, margin, SIZE - margin, SIZE - margin],
-                      corner_radius, fill=255)
-
-    # Create gradient image
-    grad = Image.new("RGBA", (SIZE, SIZE), (0, 0, 0, 0))
-    grad_draw = ImageDraw.Draw(grad)
-    for y in range(SIZE):
-        t = y / (SIZE - 1)
-        c = lerp_color(color_top, color_bottom, t)
-        grad_draw.line([(0, y), (SIZE - 1, y)], fill=(*c, 255))
+    mask = rounded_rect_mask(SIZE, [margin, margin, SIZE - margin, SIZE - margin],
+                             corner_radius)
+
+    # Create gradient image: one interpolated color per row, broadcast across
+    t = np.arange(SIZE)[:, None] / (SIZE - 1)
+    top = np.array(color_top, dtype=np.float64)
+    rows = (top + (np.array(color_bottom) - top) * t).astype(np.uint8)
+    pixels = np.empty((SIZE, SIZE, 4), dtype=np.uint8)
+    pixels[..., :3] = rows[:, None, :]
+    pixels[..., 3] = 255
+    grad = Image.fromarray(pixels)
 
     # Apply mask
     img.paste(grad, mask=mask)
@@ -79,8 +74,8 @@ def generate_icon():
 
     # Rectangular body
     body_radius = int(mic_w * 0.15)
-    draw_rounded_rect(draw, [cx - mic_w, mic_top, cx + mic_w, mic_bottom],
-                      body_radius, fill=mic_color)
+    draw.rounded_rectangle([cx - mic_w, mic_top, cx + mic_w, mic_bottom],
+                           radius=body_radius, fill=mic_color)
 
     # --- Microphone cradle arc ---
     cradle_w = int(SIZE * 0.24)
@@ -88,29 +83,31 @@ def generate_icon():
     cradle_bottom = mic_bottom + int(SIZE * 0.10)
     arc_thickness = int(SIZE * 0.025)
 
-    # Draw the cradle as a thick arc (bottom half of an ellipse)
-    for offset in range(arc_thickness):
-        draw.arc(
-            [cx - cradle_w - offset, cradle_top - offset,
-             cx + cradle_w + offset, cradle_bottom + offset],
-            start=0, end=180,
-            fill=mic_color, width=2
-        )
+    # Draw the cradle as a thick arc (bottom half of an ellipse). PIL grows
+    # width inward from the bbox, so this covers the same band that stacking
+    # width-2 arcs on bboxes grown by 0..arc_thickness-1 did.
+    outer = arc_thickness - 1
+    draw.arc(
+        [cx - cradle_w - outer, cradle_top - outer,
+         cx + cradle_w + outer, cradle_bottom + outer],
+        start=0, end=180,
+        fill=mic_color, width=arc_thickness + 1
+    )
 
     # --- Stand (vertical line below cradle) ---
     stand_top = cradle_bottom - int(SIZE * 0.01)
     stand_bottom = stand_top + int(SIZE * 0.10)
     stand_half_w = int(SIZE * 0.015)
-    draw_rounded_rect(draw, [cx - stand_half_w, stand_top, cx + stand_half_w, stand_bottom],
-                      stand_half_w, fill=mic_color)
+    draw.rounded_rectangle([cx - stand_half_w, stand_top, cx + stand_half_w, stand_bottom],
+                           radius=stand_half_w, fill=mic_color)
 
     # --- Base (horizontal bar) ---
     base_y = stand_bottom
     base_half_w = int(SIZE * 0.09)
     base_h = int(SIZE * 0.025)
     base_radius = base_h // 2
-    draw_rounded_rect(draw, [cx - base_half_w, base_y, cx + base_half_w, base_y + base_h],
-                      base_radius, fill=mic_color)
+    draw.rounded_rectangle([cx - base_half_w, base_y, cx + base_half_w, base_y + base_h],
+                           radius=base_radius, fill=mic_color)
 
     # --- Sound wave arcs on the sides ---
     wave_color_1 = (180, 200, 255, 130)
@@ -118,39 +115,36 @@ def generate_icon():
     wave_cy = mic_top + mic_h // 2  # center vertically on mic body
     wave_thickness = int(SIZE * 0.018)
 
-    for i, (radius_mult, color) in enumerate([(0.28, wave_color_1), (0.36, wave_color_2)]):
+    # Rasterize both arc pairs from one radius/angle field. Like draw.arc,
+    # the band is written straight into the pixels rather than blended, and
+    # grows inward from the radius by wave_thickness.
+    ys, xs = np.ogrid[:SIZE, :SIZE]
+    dx, dy = xs - cx, ys - wave_cy
+    dist = np.hypot(dx, dy)
+    theta = np.abs(np.arctan2(dy, dx))
+    # Right side (-40..40 degrees) and left side (140..220 degrees)
+    sides = (theta <= np.radians(40)) | (theta >= np.radians(140))
+    pixels = np.array(img)
+    for radius_mult, color in [(0.28, wave_color_1), (0.36, wave_color_2)]:
         r = int(SIZE * radius_mult)
-        # Right side arcs
-        bbox = [cx - r, wave_cy - r, cx + r, wave_cy + r]
-        # We draw arcs only on the right side (roughly -50 to 50 degrees)
-        # Right
-        draw.arc(bbox, start=-40, end=40, fill=color, width=wave_thickness)
-        # Left
-        draw.arc(bbox, start=140, end=220, fill=color, width=wave_thickness)
+        pixels[sides & (dist <= r) & (dist > r - wave_thickness)] = color
+    img = Image.fromarray(pixels)
 
     # --- Small glow/highlight on mic top ---
     highlight_r = int(mic_w * 0.35)
     highlight_cy = mic_top - int(mic_w * 0.15)
-    highlight = Image.new("RGBA", (SIZE, SIZE), (0, 0, 0, 0))
+    # Blend a layer just big enough for the ellipse, in place; drawing straight
+    # into img would overwrite the pixels with the translucent fill, not blend
+    highlight = Image.new("RGBA", (2 * highlight_r + 1, 2 * highlight_r + 1), (0, 0, 0, 0))
     h_draw = ImageDraw.Draw(highlight)
-    h_draw.ellipse(
-        [cx - highlight_r, highlight_cy - highlight_r,
-         cx + highlight_r, highlight_cy + highlight_r],
-        fill=(255, 255, 255, 60)
-    )
-    img = Image.alpha_composite(img, highlight)
+    h_draw.ellipse([0, 0, 2 * highlight_r, 2 * highlight_r], fill=(255, 255, 255, 60))
+    img.alpha_composite(highlight, dest=(cx - highlight_r, highlight_cy - highlight_r))
 
-    img.save(OUTPUT_PNG, "PNG")
-    print(f"Generated {OUTPUT_PNG}")
     return img
 
 
-def create_iconset():
+def create_iconset(base_img):
     """Create .iconset folder with all required sizes and convert to .icns."""
-    if os.path.exists(ICONSET_DIR):
-        shutil.rmtree(ICONSET_DIR)
-    os.makedirs(ICONSET_DIR)
-
     # Required icon sizes for macOS .iconset
     # Format: (filename, pixel_size)
     sizes = [
@@ -168,37 +162,53 @@ def create_iconset():
         ("icon_512x512@2x.png", 1024),
     ]
 
-    base_img = Image.open(OUTPUT_PNG)
-
-    for filename, px in sizes:
-        resized = base_img.resize((px, px), Image.LANCZOS)
-        out_path = os.path.join(ICONSET_DIR, filename)
-        resized.save(out_path, "PNG")
-
-    print(f"Created iconset at {ICONSET_DIR}")
-
-    # Convert to .icns using iconutil
-    if os.path.exists(OUTPUT_ICNS):
-        os.remove(OUTPUT_ICNS)
-
-    result = subprocess.run(
-        ["iconutil", "-c", "icns", ICONSET_DIR, "-o", OUTPUT_ICNS],
-        capture_output=True, text=True
-    )
-    if result.returncode != 0:
-        print(f"iconutil error: {result.stderr}", file=sys.stderr)
-        sys.exit(1)
+    # Each pixel size is used twice (NxN and N/2@2x); render it once, halving
+    # from the next size up rather than resampling the full 1024 image each time
+    rendered = {SIZE: base_img}
+    for px in sorted({px for _, px in sizes}, reverse=True):
+        if px not in rendered:
+            rendered[px] = rendered[px * 2].resize((px, px), Image.LANCZOS)
+
+    # The PNGs only live until iconutil has read them: keep them in the system
+    # temp dir (iconutil requires the .iconset suffix), removed on exit
+    with tempfile.TemporaryDirectory(suffix=".iconset") as iconset_dir:
+        # Encode each size once; its second filename gets a copy of the same bytes
+        encoded = {}
+        for filename, px in sizes:
+            if px not in encoded:
+                buf = io.BytesIO()
+                rendered[px].save(buf, "PNG")
+                encoded[px] = buf.getvalue()
+            out_path = os.path.join(iconset_dir, filename)
+            with open(out_path, "wb") as f:
+                f.write(encoded[px])
+
+        # Convert to .icns using iconutil
+        if os.path.exists(OUTPUT_ICNS):
+            os.remove(OUTPUT_ICNS)
+
+        result = subprocess.run(
+            ["iconutil", "-c", "icns", iconset_dir, "-o", OUTPUT_ICNS],
+            capture_output=True, text=True
+        )
+        if result.returncode != 0:
+            print(f"iconutil error: {result.stderr}", file=sys.stderr)
+            sys.exit(1)
 
     print(f"Generated {OUTPUT_ICNS}")
 
-    # Clean up
-    shutil.rmtree(ICONSET_DIR)
-    if os.path.exists(OUTPUT_PNG):
-        os.remove(OUTPUT_PNG)
-    print("Cleaned up temporary files.")
-
 
 if __name__ == "__main__":
-    generate_icon()
-    create_iconset()
+    keep_png = "--keep-png" in sys.argv[1:]
+    # The icon is fully determined by this script; skip the work if the .icns is
+    # newer, unless a rebuild or the PNG was asked for
+    if ("--force" not in sys.argv[1:] and not keep_png and os.path.exists(OUTPUT_ICNS)
+            and os.path.getmtime(OUTPUT_ICNS) > os.path.getmtime(__file__)):
+        print(f"{OUTPUT_ICNS} is up to date (use --force to regenerate)")
+        sys.exit(0)
+    img = generate_icon()
+    if keep_png:
+        img.save(OUTPUT_PNG, "PNG")
+        print(f"Generated {OUTPUT_PNG}")
+    create_iconset(img)
     print("Done!")